@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import timedelta
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -46,32 +46,14 @@ class SLAMonitorService:
             if overdue_transitions:
                 logger.info(f"Found {len(overdue_transitions)} SLA violations")
                 
-                for transition in overdue_transitions:
-                    try:
-                        # Calculate how overdue the application is
-                        overdue_hours = (datetime.utcnow() - transition.sla_deadline).total_seconds() / 3600
-                        
-                        # Determine escalation type based on how overdue
-                        if overdue_hours < 24:
-                            escalation_type = "warning"
-                        elif overdue_hours < 72:
-                            escalation_type = "critical"
-                        else:
-                            escalation_type = "overdue"
-                        
-                        # Create escalation
-                        escalation = workflow_service.escalate_sla_violation(
-                            stage_transition=transition,
-                            escalation_type=escalation_type
-                        )
-                        
-                        logger.info(f"Created {escalation_type} escalation for application {transition.application_id}")
-                        
-                        # TODO: Send notification to escalated user
-                        # This would integrate with the notification service
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to escalate SLA violation for transition {transition.id}: {e}")
+                # Escalation type is derived per transition from how overdue it is
+                escalations = workflow_service.escalate_sla_violations_bulk(overdue_transitions)
+                
+                for escalation in escalations:
+                    logger.info(f"Created {escalation.escalation_type} escalation for application {escalation.application_id}")
+                
+                # TODO: Send notification to escalated users
+                # This would integrate with the notification service
             
         except Exception as e:
             logger.error(f"Error checking SLA violations: {e}")
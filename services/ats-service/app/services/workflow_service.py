@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, insert, update
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from uuid import UUID
@@ -78,29 +78,34 @@ class WorkflowService:
         if not target_stage:
             raise ValueError(f"Workflow stage {stage_id} not found")
         
-        # Close any current stage transition
-        current_transition = self.db.query(StageTransition).filter(
-            and_(
-                StageTransition.application_id == application_id,
-                StageTransition.exited_at.is_(None)
-            )
-        ).first()
-        
-        if current_transition:
-            current_transition.exited_at = datetime.utcnow()
-        
-        # Calculate SLA deadline
-        sla_deadline = datetime.utcnow() + timedelta(hours=target_stage.sla_hours)
+        now = datetime.utcnow()
         
-        # Create new stage transition
-        new_transition = StageTransition(
-            application_id=application_id,
-            stage_id=stage_id,
-            sla_deadline=sla_deadline,
-            notes=notes
+        # Close any current stage transition in place, without loading it first
+        self.db.execute(
+            update(StageTransition)
+            .where(
+                and_(
+                    StageTransition.application_id == application_id,
+                    StageTransition.exited_at.is_(None)
+                )
+            )
+            .values(exited_at=now)
         )
         
-        self.db.add(new_transition)
+        # Calculate SLA deadline
+        sla_deadline = now + timedelta(hours=target_stage.sla_hours)
+        
+        # Create new stage transition; RETURNING hands back the server-side
+        # defaults so no refresh SELECT is needed after commit
+        new_transition = self.db.scalars(
+            insert(StageTransition).returning(StageTransition),
+            [{
+                "application_id": application_id,
+                "stage_id": stage_id,
+                "sla_deadline": sla_deadline,
+                "notes": notes
+            }]
+        ).one()
         
         # Update application status to match stage name
         old_status = application.status
@@ -117,7 +122,6 @@ class WorkflowService:
         
         self.db.add(status_history)
         self.db.commit()
-        self.db.refresh(new_transition)
         
         logger.info(f"Application {application_id} advanced to stage {target_stage.name}")
         return new_transition
@@ -145,6 +149,15 @@ class WorkflowService:
         
         return overdue_transitions
     
+    @staticmethod
+    def get_escalation_type(overdue_hours: float) -> str:
+        """Determine escalation type based on how overdue a transition is"""
+        if overdue_hours < 24:
+            return "warning"
+        elif overdue_hours < 72:
+            return "critical"
+        return "overdue"
+    
     def escalate_sla_violation(
         self, 
         stage_transition: StageTransition, 
@@ -152,35 +165,79 @@ class WorkflowService:
     ) -> SLAEscalation:
         """Escalate an SLA violation to the hiring manager"""
         
-        # Get the job's hiring manager (creator)
-        application = stage_transition.application
-        job = self.db.query(JobPosting).filter(
-            JobPosting.id == application.job_id
-        ).first()
+        escalations = self.escalate_sla_violations_bulk(
+            [stage_transition], escalation_type=escalation_type
+        )
         
-        if not job:
-            raise ValueError(f"Job posting not found for application {application.id}")
+        if not escalations:
+            raise ValueError(f"Job posting not found for application {stage_transition.application_id}")
         
-        # Create escalation record
-        escalation = SLAEscalation(
-            application_id=application.id,
-            stage_transition_id=stage_transition.id,
-            escalation_type=escalation_type,
-            escalated_to=job.created_by,
-            escalation_reason=f"Application has exceeded SLA deadline by {datetime.utcnow() - stage_transition.sla_deadline}"
+        return escalations[0]
+    
+    def escalate_sla_violations_bulk(
+        self,
+        stage_transitions: List[StageTransition],
+        escalation_type: Optional[str] = None
+    ) -> List[SLAEscalation]:
+        """Escalate many SLA violations with two set-based statements.
+        
+        When escalation_type is not given it is derived per transition from
+        how far past its SLA deadline the transition is.
+        """
+        if not stage_transitions:
+            return []
+        
+        # Resolve every hiring manager (job creator) in a single query
+        application_ids = {t.application_id for t in stage_transitions}
+        hiring_managers = dict(
+            self.db.query(Application.id, JobPosting.created_by)
+            .join(JobPosting, JobPosting.id == Application.job_id)
+            .filter(Application.id.in_(application_ids))
+            .all()
         )
         
-        # Mark stage transition as escalated
-        stage_transition.is_escalated = True
-        stage_transition.escalated_at = datetime.utcnow()
-        stage_transition.escalated_to = job.created_by
+        now = datetime.utcnow()
+        transition_updates = []
+        escalation_rows = []
+        
+        for transition in stage_transitions:
+            escalated_to = hiring_managers.get(transition.application_id)
+            if escalated_to is None:
+                logger.error(f"Job posting not found for application {transition.application_id}")
+                continue
+            
+            overdue = now - transition.sla_deadline
+            transition_updates.append({
+                "id": transition.id,
+                "is_escalated": True,
+                "escalated_at": now,
+                "escalated_to": escalated_to
+            })
+            escalation_rows.append({
+                "application_id": transition.application_id,
+                "stage_transition_id": transition.id,
+                "escalation_type": escalation_type or self.get_escalation_type(overdue.total_seconds() / 3600),
+                "escalated_to": escalated_to,
+                "escalation_reason": f"Application has exceeded SLA deadline by {overdue}"
+            })
+        
+        if not escalation_rows:
+            return []
+        
+        # Mark stage transitions as escalated (executemany by primary key)
+        self.db.execute(update(StageTransition), transition_updates)
+        
+        # Create escalation records, returning the inserted rows
+        escalations = self.db.scalars(
+            insert(SLAEscalation).returning(SLAEscalation),
+            escalation_rows
+        ).all()
         
-        self.db.add(escalation)
         self.db.commit()
-        self.db.refresh(escalation)
         
-        logger.warning(f"SLA violation escalated for application {application.id}")
-        return escalation
+        for escalation in escalations:
+            logger.warning(f"SLA violation escalated for application {escalation.application_id}")
+        return escalations
     
     def get_applications_by_stage(self, job_id: UUID, stage_name: str) -> List[Application]:
         """Get all applications currently in a specific stage"""
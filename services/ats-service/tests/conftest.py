@@ -9,8 +9,12 @@ from sqlalchemy.types import TypeDecorator, CHAR
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 
+# Each pytest-xdist worker gets its own SQLite file so parallel runs don't collide
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+SQLALCHEMY_DATABASE_URL = f"sqlite:///./test_{XDIST_WORKER}.db" if XDIST_WORKER else "sqlite:///./test.db"
+
 # Set test environment
-os.environ["DATABASE_URL"] = "sqlite:///./test.db"
+os.environ["DATABASE_URL"] = SQLALCHEMY_DATABASE_URL
 
 # Custom UUID type for SQLite
 class GUID(TypeDecorator):
@@ -57,13 +61,13 @@ from app.models import Base
 from app.main import app
 
 # Create test database engine
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Objects stay loaded after commit, so tests don't pay a SELECT per refresh
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
 
 def override_get_db():
     """Override database dependency for testing"""
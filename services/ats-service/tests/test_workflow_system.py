@@ -37,7 +37,6 @@ class TestWorkflowService:
         )
         self.db.add(self.user)
         self.db.commit()
-        self.db.refresh(self.user)
         
         # Create test candidate
         self.candidate = Candidate(
@@ -47,7 +46,6 @@ class TestWorkflowService:
         )
         self.db.add(self.candidate)
         self.db.commit()
-        self.db.refresh(self.candidate)
         
         # Create test job
         self.job = JobPosting(
@@ -60,7 +58,6 @@ class TestWorkflowService:
         )
         self.db.add(self.job)
         self.db.commit()
-        self.db.refresh(self.job)
         
         # Create test application
         self.application = Application(
@@ -70,7 +67,6 @@ class TestWorkflowService:
         )
         self.db.add(self.application)
         self.db.commit()
-        self.db.refresh(self.application)
         
         self.workflow_service = WorkflowService(self.db)
     
@@ -137,7 +133,6 @@ class TestWorkflowService:
         assert time_diff < 60  # Within 1 minute tolerance
         
         # Verify application status was updated
-        self.db.refresh(self.application)
         assert self.application.status == "initial_screening"
         
         # Verify status history was created
@@ -191,7 +186,6 @@ class TestWorkflowService:
         assert new_current_transition.stage_id == interview_stage.id
         
         # Verify previous transition was closed
-        self.db.refresh(transition)
         assert transition.exited_at is not None
     
     def test_sla_violation_detection(self):
@@ -234,8 +228,9 @@ class TestWorkflowService:
         assert escalation.escalated_to == self.job.created_by
         assert escalation.is_resolved == False
         
-        # Verify transition was marked as escalated
-        self.db.refresh(transition)
+        # Verify transition was marked as escalated (updated by a bulk
+        # UPDATE, so reload just the escalation columns)
+        self.db.expire(transition, ['is_escalated', 'escalated_at', 'escalated_to'])
         assert transition.is_escalated == True
         assert transition.escalated_at is not None
         assert transition.escalated_to == self.job.created_by
@@ -244,6 +239,58 @@ class TestWorkflowService:
         new_violations = self.workflow_service.check_sla_violations()
         assert len(new_violations) == 0
     
+    def test_bulk_sla_escalation(self):
+        """Test escalating several SLA violations in one batch"""
+        # Requirements: 1.7 - SLA tracking and escalation rules
+
+        candidate2 = Candidate(
+            email="candidate2.bulk@example.com",
+            first_name="Bulk",
+            last_name="Candidate"
+        )
+        self.db.add(candidate2)
+        self.db.commit()
+
+        application2 = Application(
+            candidate_id=candidate2.id,
+            job_id=self.job.id,
+            status="applied"
+        )
+        self.db.add(application2)
+        self.db.commit()
+
+        stages = self.workflow_service.create_default_workflow_stages(self.job.id)
+
+        transitions = [
+            self.workflow_service.advance_application_to_stage(
+                application_id=application_id,
+                stage_id=stages[1].id,
+                user_id=self.user.id
+            )
+            for application_id in (self.application.id, application2.id)
+        ]
+
+        # One transition slightly overdue, one overdue by several days
+        transitions[0].sla_deadline = datetime.utcnow() - timedelta(hours=1)
+        transitions[1].sla_deadline = datetime.utcnow() - timedelta(hours=100)
+        self.db.commit()
+
+        violations = self.workflow_service.check_sla_violations()
+        assert len(violations) == 2
+
+        escalations = self.workflow_service.escalate_sla_violations_bulk(violations)
+
+        assert len(escalations) == 2
+        types_by_transition = {e.stage_transition_id: e.escalation_type for e in escalations}
+        assert types_by_transition[transitions[0].id] == "warning"
+        assert types_by_transition[transitions[1].id] == "overdue"
+        assert all(e.escalated_to == self.job.created_by for e in escalations)
+        assert all(e.id is not None for e in escalations)
+
+        # Verify no more violations detected once escalated
+        assert self.workflow_service.check_sla_violations() == []
+        assert self.workflow_service.escalate_sla_violations_bulk([]) == []
+
     def test_get_escalated_applications(self):
         """Test retrieving applications escalated to a user"""
         # Requirements: 1.7 - SLA escalation and management
@@ -328,7 +375,6 @@ class TestWorkflowService:
         )
         self.db.add(candidate2)
         self.db.commit()
-        self.db.refresh(candidate2)
         
         application2 = Application(
             candidate_id=candidate2.id,
@@ -337,7 +383,6 @@ class TestWorkflowService:
         )
         self.db.add(application2)
         self.db.commit()
-        self.db.refresh(application2)
         
         # Create workflow stages
         stages = self.workflow_service.create_default_workflow_stages(self.job.id)
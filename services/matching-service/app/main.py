@@ -7,8 +7,10 @@ Requirements: 3.1, 3.2, 3.3, 3.4, 3.5, 3.6, 3.7
 
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from typing import Dict, List, Any
 import logging
+import orjson
 
 from .services.matching_engine import MatchingEngine
 from .services.semantic_matcher import SemanticMatcher
@@ -18,10 +20,22 @@ from .services.decision_engine import DecisionEngine
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+class MatchingJSONResponse(ORJSONResponse):
+    """orjson response that also serializes NumPy scores and naive datetimes as UTC"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+        )
+
+
 app = FastAPI(
     title="Candidate Matching Service",
     description="Intelligent candidate matching and screening service",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=MatchingJSONResponse
 )
 
 # Add CORS middleware
@@ -38,6 +52,14 @@ matching_engine = MatchingEngine()
 semantic_matcher = SemanticMatcher()
 decision_engine = DecisionEngine()
 
+@app.on_event("startup")
+async def startup_event():
+    """Precompute skill expansions for every skill the semantic matcher knows"""
+    app.state.expansion_cache = semantic_matcher.expand_skill_requirements(
+        sorted(semantic_matcher.get_known_skills())
+    )
+    logger.info(f"Precomputed expansions for {len(app.state.expansion_cache)} skills")
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -189,7 +211,20 @@ async def expand_skills(request: Dict[str, Any]):
         if not required_skills:
             return {"expanded_skills": {}}
         
-        expanded = semantic_matcher.expand_skill_requirements(required_skills)
+        # Known skills are served from the startup cache; only unknown ones go through the
+        # semantic matcher, as every skill does when the app runs without its startup event
+        expansion_cache = getattr(app.state, "expansion_cache", {})
+        uncached = semantic_matcher.expand_skill_requirements(
+            [skill for skill in required_skills if skill.lower() not in expansion_cache]
+        )
+        
+        expanded = {}
+        for skill in required_skills:
+            if skill in uncached:
+                expanded[skill] = uncached[skill]
+            else:
+                # Cached expansions are keyed by lowercase skill; keep the caller's spelling
+                expanded[skill] = [(skill, 1.0)] + expansion_cache[skill.lower()][1:]
         
         return {
             "original_skills": required_skills,
@@ -5,12 +5,42 @@ Implements auto-shortlisting, auto-rejection, and diversity filters.
 Requirements: 3.5, 3.6, 3.7
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, NamedTuple, Optional, Set, Tuple
 from enum import Enum
 import logging
+import re
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Keyword patterns for diversity checks, compiled once at import
+_DIVERSITY_EDUCATION_RE = re.compile(r'associate|bootcamp|certificate', re.IGNORECASE)
+_ALTERNATIVE_EDUCATION_RE = re.compile(r'bootcamp|certificate', re.IGNORECASE)
+_DIVERSITY_LOCATION_RE = re.compile(r'remote|international|global', re.IGNORECASE)
+_REMOTE_RE = re.compile(r'remote', re.IGNORECASE)
+
+_DIVERSITY_GENDERS = frozenset(['female', 'non-binary', 'other'])
+_UNDERREPRESENTED_GENDERS = frozenset(['female', 'non-binary'])
+
+# Diversity counters are a fixed (dimension x category) array; unlisted genders share the last slot
+_GENDER_INDEX = {'female': 0, 'male': 1, 'non-binary': 2, 'other': 3}
+_UNLISTED_GENDER = 4
+_UNDERREPRESENTED_GENDER_INDICES = frozenset(_GENDER_INDEX[gender] for gender in _UNDERREPRESENTED_GENDERS)
+_GENDER, _EXPERIENCE_LEVEL, _EDUCATION_TYPE, _LOCATION_TYPE = range(4)
+_JUNIOR, _MID, _SENIOR, _EXPERT = range(4)
+_EXPERIENCE_LEVEL_BINS = np.array([2.0, 5.0, 10.0])
+_TRADITIONAL, _ALTERNATIVE = range(2)
+_ONSITE, _REMOTE = range(2)
+
+class _DiversityColumns(NamedTuple):
+    """Per-candidate diversity features, one column per attribute"""
+    gender: List[int]
+    experience_level: List[int]
+    over_ten_years: List[bool]
+    alternative_education: List[bool]
+    remote: List[bool]
+
 class DecisionType(Enum):
     """Decision types for candidate screening"""
     AUTO_SHORTLIST = "auto_shortlist"
@@ -50,33 +80,41 @@ class DecisionEngine:
             'summary': {}
         }
         
-        # Sort candidates by score (descending)
-        sorted_candidates = sorted(scored_candidates, 
-                                 key=lambda x: x.get('match_score', 0), 
-                                 reverse=True)
+        scores = np.fromiter(
+            (c.get('match_score', 0) for c in scored_candidates),
+            dtype=np.float64, count=len(scored_candidates)
+        )
         
-        # Apply initial screening rules
-        for candidate_data in sorted_candidates:
+        # Threshold rules split candidates into score bands in one linear pass;
+        # each band is then ordered on its own instead of sorting the whole pool
+        shortlist_mask = scores >= self.config['auto_shortlist_threshold']
+        reject_mask = ~shortlist_mask & (scores <= self.config['auto_reject_threshold'])
+        middle_mask = ~(shortlist_mask | reject_mask)
+        
+        decisions['auto_shortlisted'] = [scored_candidates[i] for i in self._rank_band(scores, shortlist_mask)]
+        
+        # Only the middle band needs the critical gap and diversity checks
+        for i in self._rank_band(scores, middle_mask):
+            candidate_data = scored_candidates[i]
             decision = self._evaluate_candidate(candidate_data, job_requirements)
             
-            if decision == DecisionType.AUTO_SHORTLIST:
-                decisions['auto_shortlisted'].append(candidate_data)
-            elif decision == DecisionType.AUTO_REJECT:
+            if decision == DecisionType.AUTO_REJECT:
                 decisions['auto_rejected'].append(candidate_data)
             elif decision == DecisionType.DIVERSITY_HOLD:
                 decisions['diversity_held'].append(candidate_data)
             else:
                 decisions['manual_review'].append(candidate_data)
         
+        # Score-based rejections rank below every middle-band candidate
+        decisions['auto_rejected'].extend(scored_candidates[i] for i in self._rank_band(scores, reject_mask))
+        
         # Apply diversity filters
-        final_shortlist = self._apply_diversity_filters(
+        final_shortlist, shortlisted_ids = self._apply_diversity_filters(
             decisions['auto_shortlisted'] + decisions['diversity_held'],
             job_requirements
         )
         
         # Update decisions based on diversity filtering
-        shortlisted_ids = {c['candidate']['id'] for c in final_shortlist}
-        
         # Move non-selected diversity candidates to manual review
         for candidate_data in decisions['diversity_held']:
             if candidate_data['candidate']['id'] not in shortlisted_ids:
@@ -90,9 +128,28 @@ class DecisionEngine:
         
         return decisions
     
+    @staticmethod
+    def _rank_band(scores: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """Indices of the masked candidates by descending score.
+        
+        The stable argsort keeps the original order among equal scores, like
+        sorted(..., reverse=True).
+        """
+        indices = np.flatnonzero(mask)
+        return indices[np.argsort(-scores[indices], kind='stable')]
+    
     def _evaluate_candidate(self, candidate_data: Dict[str, Any], 
                           job_requirements: Dict[str, Any]) -> DecisionType:
         """Evaluate individual candidate for automated decision"""
+        return self._assess_candidate(candidate_data, job_requirements)[0]
+    
+    def _assess_candidate(self, candidate_data: Dict[str, Any], 
+                        job_requirements: Dict[str, Any]) -> Tuple[DecisionType, Optional[bool], Optional[bool]]:
+        """Evaluate a candidate and return the checks computed along the way.
+        
+        Returns (decision, has_critical_gaps, adds_diversity_value); a check is None
+        when the decision was reached before it had to be evaluated.
+        """
         
         match_score = candidate_data.get('match_score', 0)
         candidate = candidate_data.get('candidate', {})
@@ -100,21 +157,21 @@ class DecisionEngine:
         
         # Auto-shortlist high-scoring candidates
         if match_score >= self.config['auto_shortlist_threshold']:
-            return DecisionType.AUTO_SHORTLIST
+            return DecisionType.AUTO_SHORTLIST, None, None
         
         # Auto-reject low-scoring candidates
         if match_score <= self.config['auto_reject_threshold']:
-            return DecisionType.AUTO_REJECT
+            return DecisionType.AUTO_REJECT, None, None
         
         # Check for critical requirements
         if self._has_critical_gaps(match_details, job_requirements):
-            return DecisionType.AUTO_REJECT
+            return DecisionType.AUTO_REJECT, True, None
         
         # Check if candidate adds diversity value
         if self._adds_diversity_value(candidate, job_requirements):
-            return DecisionType.DIVERSITY_HOLD
+            return DecisionType.DIVERSITY_HOLD, False, True
         
-        return DecisionType.MANUAL_REVIEW
+        return DecisionType.MANUAL_REVIEW, False, False
     
     def _has_critical_gaps(self, match_details: Dict[str, Any], 
                           job_requirements: Dict[str, Any]) -> bool:
@@ -152,7 +209,7 @@ class DecisionEngine:
         
         # Gender diversity (if available)
         gender = candidate.get('gender', '').lower()
-        if gender in ['female', 'non-binary', 'other']:
+        if gender in _DIVERSITY_GENDERS:
             diversity_factors.append('gender')
         
         # Experience level diversity
@@ -164,114 +221,98 @@ class DecisionEngine:
         
         # Educational background diversity
         education = candidate.get('education', [])
-        for edu in education:
-            degree = edu.get('degree', '').lower()
-            if 'associate' in degree or 'bootcamp' in degree or 'certificate' in degree:
-                diversity_factors.append('alternative_education')
-                break
+        if any(_DIVERSITY_EDUCATION_RE.search(edu.get('degree', '')) for edu in education):
+            diversity_factors.append('alternative_education')
         
         # Location diversity
-        location = candidate.get('location', '').lower()
-        if 'remote' in location or any(city in location for city in ['international', 'global']):
+        if _DIVERSITY_LOCATION_RE.search(candidate.get('location', '')):
             diversity_factors.append('location_diversity')
         
         return len(diversity_factors) > 0
     
     def _apply_diversity_filters(self, candidates: List[Dict[str, Any]], 
-                               job_requirements: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Apply diversity filters to create balanced shortlist"""
+                               job_requirements: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Set[Any]]:
+        """Apply diversity filters to create balanced shortlist.
         
-        if not candidates:
-            return []
+        Candidates must already be ordered by descending match score. Returns the
+        shortlist together with the set of shortlisted candidate ids.
+        """
         
-        # Sort by match score
-        candidates.sort(key=lambda x: x.get('match_score', 0), reverse=True)
+        if not candidates:
+            return [], set()
         
-        # Start with top performers
+        # Start with top performers; ids give O(1) membership checks
         shortlist = []
-        diversity_stats = {
-            'gender': {},
-            'experience_level': {},
-            'education_type': {},
-            'location_type': {}
-        }
+        shortlisted_ids = set()
+        diversity_stats = np.zeros((4, _UNLISTED_GENDER + 1), dtype=np.int32)
         
         max_size = self.config['max_shortlist_size']
+        min_size = self.config['min_shortlist_size']
+        columns = self._diversity_columns(candidates)
         
-        # First pass: Add top candidates regardless of diversity
+        # Single pass: top candidates come first in score order and are added
+        # regardless of diversity, the rest only if they improve diversity or the
+        # shortlist is still below its minimum size
         top_threshold = 0.9
-        for candidate_data in candidates:
-            if len(shortlist) >= max_size:
-                break
-            
-            if candidate_data.get('match_score', 0) >= top_threshold:
-                shortlist.append(candidate_data)
-                self._update_diversity_stats(candidate_data['candidate'], diversity_stats)
-        
-        # Second pass: Add candidates considering diversity
-        for candidate_data in candidates:
+        for index, candidate_data in enumerate(candidates):
             if len(shortlist) >= max_size:
                 break
             
-            if candidate_data in shortlist:
-                continue
-            
             candidate = candidate_data['candidate']
             
-            # Check if adding this candidate improves diversity
-            if self._improves_diversity(candidate, diversity_stats, len(shortlist)):
-                shortlist.append(candidate_data)
-                self._update_diversity_stats(candidate, diversity_stats)
-            elif len(shortlist) < self.config['min_shortlist_size']:
-                # Add anyway if we haven't reached minimum size
-                shortlist.append(candidate_data)
-                self._update_diversity_stats(candidate, diversity_stats)
-        
-        return shortlist
+            if candidate_data.get('match_score', 0) < top_threshold:
+                if candidate['id'] in shortlisted_ids:
+                    continue
+                
+                if not (self._improves_diversity(columns, index, diversity_stats, len(shortlist))
+                        or len(shortlist) < min_size):
+                    continue
+            
+            shortlist.append(candidate_data)
+            shortlisted_ids.add(candidate['id'])
+            self._update_diversity_stats(columns, index, diversity_stats)
+        
+        return shortlist, shortlisted_ids
+    
+    def _diversity_columns(self, candidates: List[Dict[str, Any]]) -> _DiversityColumns:
+        """Extract the diversity features of every candidate once per batch"""
+        profiles = [candidate_data['candidate'] for candidate_data in candidates]
+        experience = np.fromiter((candidate.get('total_experience', 0) for candidate in profiles),
+                                 dtype=np.float64, count=len(profiles))
+        
+        return _DiversityColumns(
+            gender=[_GENDER_INDEX.get(candidate.get('gender', 'not_specified').lower(), _UNLISTED_GENDER)
+                    for candidate in profiles],
+            experience_level=np.digitize(experience, _EXPERIENCE_LEVEL_BINS).tolist(),
+            over_ten_years=(experience > 10).tolist(),
+            alternative_education=[self._has_alternative_education(candidate.get('education', []))
+                                   for candidate in profiles],
+            remote=[_REMOTE_RE.search(candidate.get('location', '')) is not None for candidate in profiles]
+        )
     
-    def _update_diversity_stats(self, candidate: Dict[str, Any], 
-                              diversity_stats: Dict[str, Dict[str, int]]):
+    def _update_diversity_stats(self, columns: _DiversityColumns, index: int,
+                              diversity_stats: np.ndarray):
         """Update diversity statistics with new candidate"""
         
         # Gender
-        gender = candidate.get('gender', 'not_specified').lower()
-        diversity_stats['gender'][gender] = diversity_stats['gender'].get(gender, 0) + 1
+        diversity_stats[_GENDER, columns.gender[index]] += 1
         
         # Experience level
-        experience = candidate.get('total_experience', 0)
-        if experience < 2:
-            level = 'junior'
-        elif experience < 5:
-            level = 'mid'
-        elif experience < 10:
-            level = 'senior'
-        else:
-            level = 'expert'
-        
-        diversity_stats['experience_level'][level] = diversity_stats['experience_level'].get(level, 0) + 1
+        diversity_stats[_EXPERIENCE_LEVEL, columns.experience_level[index]] += 1
         
         # Education type
-        education = candidate.get('education', [])
-        edu_type = 'traditional'
-        for edu in education:
-            degree = edu.get('degree', '').lower()
-            if 'bootcamp' in degree or 'certificate' in degree:
-                edu_type = 'alternative'
-                break
-        
-        diversity_stats['education_type'][edu_type] = diversity_stats['education_type'].get(edu_type, 0) + 1
+        diversity_stats[_EDUCATION_TYPE, _ALTERNATIVE if columns.alternative_education[index] else _TRADITIONAL] += 1
         
         # Location type
-        location = candidate.get('location', '').lower()
-        if 'remote' in location:
-            loc_type = 'remote'
-        else:
-            loc_type = 'onsite'
-        
-        diversity_stats['location_type'][loc_type] = diversity_stats['location_type'].get(loc_type, 0) + 1
+        diversity_stats[_LOCATION_TYPE, _REMOTE if columns.remote[index] else _ONSITE] += 1
+    
+    @staticmethod
+    def _has_alternative_education(education: List[Dict[str, Any]]) -> bool:
+        """Check for a bootcamp or certificate among the candidate's degrees"""
+        return any(_ALTERNATIVE_EDUCATION_RE.search(edu.get('degree', '')) for edu in education)
     
-    def _improves_diversity(self, candidate: Dict[str, Any], 
-                          diversity_stats: Dict[str, Dict[str, int]], 
+    def _improves_diversity(self, columns: _DiversityColumns, index: int,
+                          diversity_stats: np.ndarray, 
                           current_size: int) -> bool:
         """Check if adding candidate improves diversity"""
         
@@ -281,28 +322,22 @@ class DecisionEngine:
         improvements = 0
         
         # Check gender diversity
-        gender = candidate.get('gender', 'not_specified').lower()
-        if gender in ['female', 'non-binary'] and diversity_stats['gender'].get(gender, 0) == 0:
+        gender = columns.gender[index]
+        if gender in _UNDERREPRESENTED_GENDER_INDICES and diversity_stats[_GENDER, gender] == 0:
             improvements += 1
         
         # Check experience diversity
-        experience = candidate.get('total_experience', 0)
-        if experience < 2 and diversity_stats['experience_level'].get('junior', 0) == 0:
+        if columns.experience_level[index] == _JUNIOR and diversity_stats[_EXPERIENCE_LEVEL, _JUNIOR] == 0:
             improvements += 1
-        elif experience > 10 and diversity_stats['experience_level'].get('expert', 0) == 0:
+        elif columns.over_ten_years[index] and diversity_stats[_EXPERIENCE_LEVEL, _EXPERT] == 0:
             improvements += 1
         
         # Check education diversity
-        education = candidate.get('education', [])
-        has_alternative_ed = any('bootcamp' in edu.get('degree', '').lower() or 
-                               'certificate' in edu.get('degree', '').lower() 
-                               for edu in education)
-        if has_alternative_ed and diversity_stats['education_type'].get('alternative', 0) == 0:
+        if columns.alternative_education[index] and diversity_stats[_EDUCATION_TYPE, _ALTERNATIVE] == 0:
             improvements += 1
         
         # Check location diversity
-        location = candidate.get('location', '').lower()
-        if 'remote' in location and diversity_stats['location_type'].get('remote', 0) == 0:
+        if columns.remote[index] and diversity_stats[_LOCATION_TYPE, _REMOTE] == 0:
             improvements += 1
         
         return improvements > 0
@@ -310,14 +345,24 @@ class DecisionEngine:
     def _generate_summary(self, decisions: Dict[str, List], total_candidates: int) -> Dict[str, Any]:
         """Generate summary of screening decisions"""
         
+        shortlisted = len(decisions['auto_shortlisted'])
+        rejected = len(decisions['auto_rejected'])
+        
+        if total_candidates > 0:
+            shortlist_rate = shortlisted / total_candidates
+            rejection_rate = rejected / total_candidates
+            automation_rate = (shortlisted + rejected) / total_candidates
+        else:
+            shortlist_rate = rejection_rate = automation_rate = 0
+        
         return {
             'total_candidates': total_candidates,
-            'auto_shortlisted': len(decisions['auto_shortlisted']),
-            'auto_rejected': len(decisions['auto_rejected']),
+            'auto_shortlisted': shortlisted,
+            'auto_rejected': rejected,
             'manual_review': len(decisions['manual_review']),
-            'shortlist_rate': len(decisions['auto_shortlisted']) / total_candidates if total_candidates > 0 else 0,
-            'rejection_rate': len(decisions['auto_rejected']) / total_candidates if total_candidates > 0 else 0,
-            'automation_rate': (len(decisions['auto_shortlisted']) + len(decisions['auto_rejected'])) / total_candidates if total_candidates > 0 else 0
+            'shortlist_rate': shortlist_rate,
+            'rejection_rate': rejection_rate,
+            'automation_rate': automation_rate
         }
     
     def update_thresholds(self, new_config: Dict[str, Any]):
@@ -333,8 +378,11 @@ class DecisionEngine:
         candidate = candidate_data.get('candidate', {})
         match_details = candidate_data.get('match_details', {})
         
+        # Reuse the checks already run while reaching the decision
+        decision, has_gaps, adds_diversity = self._assess_candidate(candidate_data, job_requirements)
+        
         explanation = {
-            'decision': self._evaluate_candidate(candidate_data, job_requirements).value,
+            'decision': decision.value,
             'match_score': match_score,
             'factors': []
         }
@@ -346,11 +394,15 @@ class DecisionEngine:
             explanation['factors'].append(f"Low match score ({match_score:.2f}) below auto-reject threshold")
         
         # Critical gaps
-        if self._has_critical_gaps(match_details, job_requirements):
+        if has_gaps is None:
+            has_gaps = self._has_critical_gaps(match_details, job_requirements)
+        if has_gaps:
             explanation['factors'].append("Has critical gaps in required qualifications")
         
         # Diversity value
-        if self._adds_diversity_value(candidate, job_requirements):
+        if adds_diversity is None:
+            adds_diversity = self._adds_diversity_value(candidate, job_requirements)
+        if adds_diversity:
             explanation['factors'].append("Adds diversity value to candidate pool")
         
         return explanation
\ No newline at end of file
@@ -7,61 +7,175 @@ Requirements: 3.1, 3.2, 3.3
 
 import math
 import re
-from typing import Dict, List, Any, Optional, Tuple
-from collections import Counter
+from typing import Callable, Dict, List, Any, NamedTuple, Optional, Tuple
 from datetime import datetime, date
+from types import MappingProxyType
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Skill to category lookup (simplified mapping); skills are lowercase
+_SKILL_CATEGORIES = {
+    'python': 'programming',
+    'java': 'programming',
+    'javascript': 'programming',
+    'react': 'web',
+    'angular': 'web',
+    'html': 'web',
+    'css': 'web',
+    'mysql': 'database',
+    'postgresql': 'database',
+    'mongodb': 'database',
+    'aws': 'cloud',
+    'azure': 'cloud',
+    'docker': 'cloud',
+    'pandas': 'data',
+    'numpy': 'data',
+    'tensorflow': 'data'
+}
+_DEFAULT_SKILL_CATEGORY = 'programming'
+
+# Zero-padded YYYY-MM-DD, parsed without strptime
+_ISO_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+# Component weights for the overall match score
+_SCORE_WEIGHTS = {
+    'skills': 0.4,
+    'experience': 0.3,
+    'education': 0.2,
+    'location': 0.1
+}
+
+# Skill category weights, used as IDF for TF-IDF
+_SKILL_WEIGHTS = MappingProxyType({
+    'programming': 1.0,
+    'web': 0.9,
+    'database': 0.8,
+    'cloud': 0.9,
+    'data': 0.8
+})
+
+_EDUCATION_LEVELS = MappingProxyType({
+    'high school': 1,
+    'associate': 2,
+    'bachelor': 3,
+    'master': 4,
+    'phd': 5,
+    'doctorate': 5
+})
+
+# One search finds every level name in a degree string; the lookahead keeps
+# overlapping names, and dict order still decides which one counts
+_EDUCATION_LEVEL_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(name) for name in _EDUCATION_LEVELS) + '))'
+)
+_EDUCATION_PRECEDENCE = MappingProxyType({name: rank for rank, name in enumerate(_EDUCATION_LEVELS)})
+
+# IDF weight per known skill, so TF-IDF needs a single lookup per skill
+_SKILL_IDF = MappingProxyType({
+    skill: _SKILL_WEIGHTS.get(category, 1.0)
+    for skill, category in _SKILL_CATEGORIES.items()
+})
+_DEFAULT_SKILL_IDF = _SKILL_WEIGHTS.get(_DEFAULT_SKILL_CATEGORY, 1.0)
+
+class _BatchScores(NamedTuple):
+    """Score columns for a candidate batch and the lowercased inputs behind each breakdown"""
+    scores: Dict[str, np.ndarray]
+    required_skill_bits: Dict[str, int]
+    candidate_skill_names: List[List[str]]
+    experience_years: np.ndarray
+    highest_education: List[Tuple[int, str]]
+    job_location_lower: str
+    candidate_locations: List[str]
+
 class MatchingEngine:
     """Core matching algorithm for candidates and job postings"""
     
     def __init__(self):
         """Initialize matching engine"""
-        self.skill_weights = {
-            'programming': 1.0,
-            'web': 0.9,
-            'database': 0.8,
-            'cloud': 0.9,
-            'data': 0.8
-        }
-        
-        self.education_levels = {
-            'high school': 1,
-            'associate': 2,
-            'bachelor': 3,
-            'master': 4,
-            'phd': 5,
-            'doctorate': 5
-        }
+        # Configuration and the indexes derived from it are module-level and shared,
+        # so constructing an engine costs nothing beyond these aliases
+        self.skill_weights = _SKILL_WEIGHTS
+        self.education_levels = _EDUCATION_LEVELS
+        self._education_level_re = _EDUCATION_LEVEL_RE
+        self._education_precedence = _EDUCATION_PRECEDENCE
+        self._skill_idf = _SKILL_IDF
+        self._default_skill_idf = _DEFAULT_SKILL_IDF
         
         logger.info("Matching engine initialized")
     
     def calculate_match_score(self, candidate: Dict[str, Any], job: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate overall match score between candidate and job"""
-        
-        # Calculate individual component scores
-        skill_score = self._calculate_skill_match(candidate.get('skills', []), job.get('required_skills', []))
-        experience_score = self._calculate_experience_match(candidate.get('experience', []), job.get('required_experience', 0))
-        education_score = self._calculate_education_match(candidate.get('education', []), job.get('required_education', ''))
-        location_score = self._calculate_location_match(candidate.get('location', ''), job.get('location', ''))
-        
-        # Weighted overall score
-        weights = {
-            'skills': 0.4,
-            'experience': 0.3,
-            'education': 0.2,
-            'location': 0.1
-        }
-        
-        overall_score = (
-            skill_score * weights['skills'] +
-            experience_score * weights['experience'] +
-            education_score * weights['education'] +
-            location_score * weights['location']
+        return self.compile_job(job)(candidate)
+    
+    def compile_job(self, job: Dict[str, Any]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """Specialize match scoring for one job.
+        
+        Everything derived from the job alone (lowercased required skills and their
+        TF-IDF vector, required education level) is computed once here; the returned
+        function only does the per-candidate work.
+        """
+        required_skill_names = [skill.lower() for skill in job.get('required_skills', [])]
+        required_skill_bits = self._skill_bits(required_skill_names)
+        required_tfidf = self._calculate_tfidf(required_skill_names)
+        required_years = job.get('required_experience', 0)
+        required_education = job.get('required_education', '')
+        required_level = self._parse_education_level(required_education) if required_education else 0
+        job_location_lower = job.get('location', '').lower()
+        job_location_words = job_location_lower.split()
+        
+        def score(candidate: Dict[str, Any]) -> Dict[str, Any]:
+            # Candidate strings are lowercased once and shared by scoring and breakdown
+            candidate_skill_names = [skill.get('skill', '').lower() for skill in candidate.get('skills', [])]
+            candidate_location = candidate.get('location', '').lower()
+            
+            skill_mask = self._skill_mask(candidate_skill_names, required_skill_bits)
+            
+            # Skills: TF-IDF cosine similarity boosted by exact matches
+            if required_skill_names:
+                similarity = self._cosine_similarity(self._calculate_tfidf(candidate_skill_names), required_tfidf)
+                match_ratio = skill_mask.bit_count() / len(required_skill_names)
+                skill_score = min((similarity * 0.6) + (match_ratio * 0.4), 1.0)
+            else:
+                skill_score = 1.0
+            
+            # Experience: extracted once, reused for the breakdown
+            experience_years = self._extract_total_experience(candidate.get('experience', []))
+            experience_score = self._score_experience(experience_years, required_years)
+            
+            # Education: one traversal yields both the level and the degree name
+            candidate_level, highest_degree = self._highest_education(candidate.get('education', []))
+            education_score = self._score_education(candidate_level, required_level) if required_education else 1.0
+            
+            location_score = self._score_location(candidate_location, job_location_lower, job_location_words)
+            
+            overall_score = self._weighted_score(skill_score, experience_score, education_score, location_score)
+            
+            return self._build_match_result(
+                overall_score, skill_score, experience_score, education_score, location_score,
+                experience_years, highest_degree, self._skills_in_mask(skill_mask, required_skill_bits),
+                self._describe_distance(candidate_location, job_location_lower)
+            )
+        
+        return score
+    
+    @staticmethod
+    def _weighted_score(skill_score, experience_score, education_score, location_score):
+        """Weighted overall score; works on floats and on NumPy score columns alike"""
+        return (
+            skill_score * _SCORE_WEIGHTS['skills'] +
+            experience_score * _SCORE_WEIGHTS['experience'] +
+            education_score * _SCORE_WEIGHTS['education'] +
+            location_score * _SCORE_WEIGHTS['location']
         )
-        
+    
+    def _build_match_result(self, overall_score: float,
+                            skill_score: float, experience_score: float, education_score: float,
+                            location_score: float, experience_years: float, highest_degree: str,
+                            skills_matched: List[str], location_distance: str) -> Dict[str, Any]:
+        """Assemble the match result from precomputed component scores"""
         return {
             'overall_score': round(overall_score, 3),
             'skill_score': round(skill_score, 3),
@@ -69,104 +183,131 @@ class MatchingEngine:
             'education_score': round(education_score, 3),
             'location_score': round(location_score, 3),
             'breakdown': {
-                'skills_matched': self._get_matched_skills(candidate.get('skills', []), job.get('required_skills', [])),
-                'experience_years': self._extract_total_experience(candidate.get('experience', [])),
-                'education_level': self._get_highest_education(candidate.get('education', [])),
-                'location_distance': self._calculate_distance(candidate.get('location', ''), job.get('location', ''))
+                'skills_matched': skills_matched,
+                'experience_years': experience_years,
+                'education_level': highest_degree,
+                'location_distance': location_distance
             }
         }
     
-    def _calculate_skill_match(self, candidate_skills: List[Dict[str, Any]], required_skills: List[str]) -> float:
-        """Calculate skill match using TF-IDF vectorization"""
-        if not required_skills:
-            return 1.0
-        
-        # Extract candidate skill names
-        candidate_skill_names = [skill.get('skill', '').lower() for skill in candidate_skills]
-        required_skill_names = [skill.lower() for skill in required_skills]
-        
-        # Calculate TF-IDF scores
-        candidate_tfidf = self._calculate_tfidf(candidate_skill_names)
-        required_tfidf = self._calculate_tfidf(required_skill_names)
-        
-        # Calculate cosine similarity
-        similarity = self._cosine_similarity(candidate_tfidf, required_tfidf)
+    @staticmethod
+    def _skill_bits(required_skill_names: List[str]) -> Dict[str, int]:
+        """Assign each distinct required skill its own bit, in requirement order"""
+        return {name: 1 << bit for bit, name in enumerate(dict.fromkeys(required_skill_names))}
+    
+    @staticmethod
+    def _skill_mask(skill_names: List[str], skill_bits: Dict[str, int]) -> int:
+        """Bitmask of the required skills present among skill_names"""
+        mask = 0
+        for name in skill_names:
+            mask |= skill_bits.get(name, 0)
+        return mask
+    
+    @staticmethod
+    def _skills_in_mask(mask: int, skill_bits: Dict[str, int]) -> List[str]:
+        """Required skills whose bit is set in mask"""
+        return [name for name, bit in skill_bits.items() if mask & bit]
+    
+    def _score_skill_names_batch(self, candidate_skill_names: List[List[str]], required_skill_names: List[str]) -> np.ndarray:
+        """Calculate skill match for many candidates at once, over already lowercased skill names.
+        
+        Every candidate becomes a row of an (M, V) TF-IDF matrix over the batch
+        vocabulary, so all cosine similarities and exact match ratios come out of
+        one matrix product.
+        """
+        num_candidates = len(candidate_skill_names)
+        if not required_skill_names:
+            return np.ones(num_candidates)
+        
+        # Intern skill names to integer ids over the batch vocabulary in a
+        # single pass, so counting below is pure array work
+        vocab: Dict[str, int] = {}
+        required_ids = np.array(
+            [vocab.setdefault(name, len(vocab)) for name in required_skill_names],
+            dtype=np.int32
+        )
+        candidate_ids = np.array(
+            [vocab.setdefault(name, len(vocab)) for names in candidate_skill_names for name in names],
+            dtype=np.int32
+        )
+        candidate_lengths = np.array([len(names) for names in candidate_skill_names], dtype=np.int32)
+        vocab_size = len(vocab)
+        
+        # Skill category weights act as IDF, as in _calculate_tfidf
+        idf = np.array([self._skill_idf.get(skill, self._default_skill_idf) for skill in vocab])
+        
+        # Per-candidate term counts via one bincount over flattened (row, skill id) cells
+        rows = np.repeat(np.arange(num_candidates, dtype=np.int32), candidate_lengths)
+        candidate_counts = np.bincount(
+            rows * vocab_size + candidate_ids, minlength=num_candidates * vocab_size
+        ).reshape(num_candidates, vocab_size)
+        required_counts = np.bincount(required_ids, minlength=vocab_size)
+        
+        # TF-IDF vectors (term frequency scaled by category weight)
+        candidate_tfidf = candidate_counts / np.maximum(candidate_lengths, 1)[:, np.newaxis] * idf
+        required_tfidf = required_counts / len(required_skill_names) * idf
+        
+        # Cosine similarity for all candidates
+        magnitudes = np.linalg.norm(candidate_tfidf, axis=1) * np.linalg.norm(required_tfidf)
+        similarity = np.divide(
+            candidate_tfidf @ required_tfidf, magnitudes,
+            out=np.zeros(num_candidates), where=magnitudes > 0
+        )
         
         # Boost score for exact matches
-        exact_matches = len(set(candidate_skill_names) & set(required_skill_names))
-        match_ratio = exact_matches / len(required_skill_names) if required_skill_names else 0
+        exact_matches = np.count_nonzero((candidate_counts > 0) & (required_counts > 0), axis=1)
+        match_ratio = exact_matches / len(required_skill_names)
         
         # Combine similarity and exact match ratio
-        final_score = (similarity * 0.6) + (match_ratio * 0.4)
-        
-        return min(final_score, 1.0)
+        return np.minimum((similarity * 0.6) + (match_ratio * 0.4), 1.0)
     
     def _calculate_tfidf(self, skills: List[str]) -> Dict[str, float]:
         """Calculate TF-IDF scores for skills"""
         if not skills:
             return {}
         
-        # Term frequency
-        tf = Counter(skills)
+        # Term frequency; a plain dict beats Counter for short skill lists
+        tf = {}
+        for skill in skills:
+            tf[skill] = tf.get(skill, 0) + 1
         total_terms = len(skills)
         
         # Simple IDF calculation (in real implementation, use corpus)
         # For now, use skill category weights as IDF proxy
-        tfidf = {}
-        for skill, count in tf.items():
-            tf_score = count / total_terms
-            idf_score = self.skill_weights.get(self._get_skill_category(skill), 1.0)
-            tfidf[skill] = tf_score * idf_score
-        
-        return tfidf
+        skill_idf = self._skill_idf
+        default_idf = self._default_skill_idf
+        return {
+            skill: count / total_terms * skill_idf.get(skill, default_idf)
+            for skill, count in tf.items()
+        }
     
     def _cosine_similarity(self, vec1: Dict[str, float], vec2: Dict[str, float]) -> float:
         """Calculate cosine similarity between two TF-IDF vectors"""
         if not vec1 or not vec2:
             return 0.0
         
-        # Get all unique terms
-        all_terms = set(vec1.keys()) | set(vec2.keys())
+        # Dot product and first norm in one pass; terms missing from vec1 add nothing
+        dot_product = 0.0
+        squared1 = 0.0
+        for term, score in vec1.items():
+            squared1 += score * score
+            dot_product += score * vec2.get(term, 0.0)
         
-        # Calculate dot product and magnitudes
-        dot_product = sum(vec1.get(term, 0) * vec2.get(term, 0) for term in all_terms)
-        magnitude1 = math.sqrt(sum(score ** 2 for score in vec1.values()))
-        magnitude2 = math.sqrt(sum(score ** 2 for score in vec2.values()))
+        squared2 = 0.0
+        for score in vec2.values():
+            squared2 += score * score
         
-        if magnitude1 == 0 or magnitude2 == 0:
+        if squared1 == 0 or squared2 == 0:
             return 0.0
         
-        return dot_product / (magnitude1 * magnitude2)
-    
-    def _get_skill_category(self, skill: str) -> str:
-        """Get category for a skill (simplified mapping)"""
-        skill_categories = {
-            'python': 'programming',
-            'java': 'programming',
-            'javascript': 'programming',
-            'react': 'web',
-            'angular': 'web',
-            'html': 'web',
-            'css': 'web',
-            'mysql': 'database',
-            'postgresql': 'database',
-            'mongodb': 'database',
-            'aws': 'cloud',
-            'azure': 'cloud',
-            'docker': 'cloud',
-            'pandas': 'data',
-            'numpy': 'data',
-            'tensorflow': 'data'
-        }
-        return skill_categories.get(skill.lower(), 'programming')
+        return dot_product / (math.sqrt(squared1) * math.sqrt(squared2))
     
-    def _calculate_experience_match(self, candidate_experience: List[Dict[str, Any]], required_years: int) -> float:
-        """Calculate experience match based on years of experience"""
+    @staticmethod
+    def _score_experience(total_experience: float, required_years: int) -> float:
+        """Score years of experience against the required years"""
         if required_years == 0:
             return 1.0
         
-        total_experience = self._extract_total_experience(candidate_experience)
-        
         if total_experience >= required_years:
             # Bonus for exceeding requirements, but cap at 1.0
             return min(1.0 + (total_experience - required_years) * 0.05, 1.0)
@@ -185,9 +326,9 @@ class MatchingEngine:
             elif 'start_date' in exp and 'end_date' in exp:
                 # Calculate years from dates
                 try:
-                    start = datetime.strptime(exp['start_date'], '%Y-%m-%d')
-                    end = datetime.strptime(exp['end_date'], '%Y-%m-%d') if exp['end_date'] else datetime.now()
-                    years = (end - start).days / 365.25
+                    start = self._parse_date(exp['start_date'])
+                    end = self._parse_date(exp['end_date']) if exp['end_date'] else date.today()
+                    years = (end.toordinal() - start.toordinal()) / 365.25
                     total_years += years
                 except:
                     # Fallback: assume 2 years per position
@@ -198,33 +339,26 @@ class MatchingEngine:
         
         return total_years
     
-    def _calculate_education_match(self, candidate_education: List[Dict[str, Any]], required_education: str) -> float:
-        """Calculate education match based on degree levels"""
-        if not required_education:
-            return 1.0
-        
-        candidate_level = self._get_highest_education_level(candidate_education)
-        required_level = self._parse_education_level(required_education)
-        
+    @staticmethod
+    def _parse_date(value: str) -> date:
+        """Parse a YYYY-MM-DD date, slicing the common zero-padded form directly"""
+        match = _ISO_DATE_RE.fullmatch(value)
+        if match:
+            return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        # Non-padded forms such as 2020-1-5 are still accepted by strptime
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    
+    @staticmethod
+    def _score_education(candidate_level: int, required_level: int) -> float:
+        """Score a candidate's education level against the required level"""
         if candidate_level >= required_level:
             return 1.0
         else:
             # Partial credit for lower education levels
             return candidate_level / required_level if required_level > 0 else 0.0
     
-    def _get_highest_education_level(self, education: List[Dict[str, Any]]) -> int:
-        """Get the highest education level from candidate's education"""
-        max_level = 0
-        
-        for edu in education:
-            degree = edu.get('degree', '').lower()
-            level = self._parse_education_level(degree)
-            max_level = max(max_level, level)
-        
-        return max_level
-    
-    def _get_highest_education(self, education: List[Dict[str, Any]]) -> str:
-        """Get the highest education degree name"""
+    def _highest_education(self, education: List[Dict[str, Any]]) -> Tuple[int, str]:
+        """Get the highest education level and its degree name from candidate's education"""
         max_level = 0
         highest_degree = 'None'
         
@@ -235,69 +369,144 @@ class MatchingEngine:
                 max_level = level
                 highest_degree = degree
         
-        return highest_degree
+        return max_level, highest_degree
     
     def _parse_education_level(self, education: str) -> int:
         """Parse education string to get numeric level"""
-        education_lower = education.lower()
+        level_names = self._education_level_re.findall(education.lower())
+        if not level_names:
+            return 0
         
-        for level_name, level_value in self.education_levels.items():
-            if level_name in education_lower:
-                return level_value
-        
-        return 0
+        # The earliest entry of education_levels present in the string wins
+        return self.education_levels[min(level_names, key=self._education_precedence.__getitem__)]
     
-    def _calculate_location_match(self, candidate_location: str, job_location: str) -> float:
-        """Calculate location proximity match"""
-        if not job_location or not candidate_location:
+    @staticmethod
+    def _score_location(candidate_lower: str, job_lower: str, job_words: List[str]) -> float:
+        """Location match over lowercased locations; job_words is job_lower.split()"""
+        if not job_lower or not candidate_lower:
             return 0.5  # Neutral score for missing location data
         
         # Simple string matching (in real implementation, use geocoding)
-        candidate_lower = candidate_location.lower()
-        job_lower = job_location.lower()
-        
         if candidate_lower == job_lower:
             return 1.0
-        elif any(word in candidate_lower for word in job_lower.split()):
+        elif any(word in candidate_lower for word in job_words):
             return 0.8
         elif 'remote' in job_lower or 'remote' in candidate_lower:
             return 0.9
         else:
             return 0.3
     
-    def _calculate_distance(self, location1: str, location2: str) -> str:
-        """Calculate distance between locations (simplified)"""
+    @staticmethod
+    def _describe_distance(location1: str, location2: str) -> str:
+        """Describe the distance between two lowercased locations"""
         if not location1 or not location2:
             return 'Unknown'
         
-        if location1.lower() == location2.lower():
+        if location1 == location2:
             return '0 miles'
-        elif 'remote' in location1.lower() or 'remote' in location2.lower():
+        elif 'remote' in location1 or 'remote' in location2:
             return 'Remote'
         else:
             return 'Different cities'
     
-    def _get_matched_skills(self, candidate_skills: List[Dict[str, Any]], required_skills: List[str]) -> List[str]:
-        """Get list of matched skills between candidate and job"""
-        candidate_skill_names = [skill.get('skill', '').lower() for skill in candidate_skills]
-        required_skill_names = [skill.lower() for skill in required_skills]
+    def calculate_match_scores_batch(self, candidates: List[Dict[str, Any]], job: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """Score many candidates against one job in a single vectorized pass.
+        
+        Returns one unrounded column per component score of calculate_match_score,
+        keyed like its result ('overall_score', 'skill_score', ...).
+        """
+        return self._score_batch(candidates, job).scores
+    
+    def _score_batch(self, candidates: List[Dict[str, Any]], job: Dict[str, Any]) -> _BatchScores:
+        """Score columns for a batch, plus the lowercased inputs the breakdowns reuse"""
+        num_candidates = len(candidates)
+        
+        # Lowercase job and candidate strings once; scoring and breakdown share them
+        required_skill_names = [skill.lower() for skill in job.get('required_skills', [])]
+        candidate_skill_names = [
+            [skill.get('skill', '').lower() for skill in candidate.get('skills', [])]
+            for candidate in candidates
+        ]
+        job_location_lower = job.get('location', '').lower()
+        job_location_words = job_location_lower.split()
+        candidate_locations = [candidate.get('location', '').lower() for candidate in candidates]
+        
+        # Score skills for the whole pool in one vectorized pass
+        skill_scores = self._score_skill_names_batch(candidate_skill_names, required_skill_names)
+        
+        # Experience: extract each candidate's years once, reused for the breakdown
+        required_years = job.get('required_experience', 0)
+        experience_years = np.fromiter(
+            (self._extract_total_experience(candidate.get('experience', [])) for candidate in candidates),
+            dtype=np.float64, count=num_candidates
+        )
+        if required_years == 0:
+            experience_scores = np.ones(num_candidates)
+        else:
+            # Exceeding the requirement caps at 1.0, as in _score_experience
+            experience_scores = np.minimum(experience_years / required_years, 1.0)
+        
+        # Education: one traversal per candidate yields both level and degree name
+        highest_education = [self._highest_education(candidate.get('education', [])) for candidate in candidates]
+        required_education = job.get('required_education', '')
+        required_level = self._parse_education_level(required_education)
+        if not required_education or required_level == 0:
+            education_scores = np.ones(num_candidates)
+        else:
+            education_levels = np.fromiter(
+                (level for level, _ in highest_education),
+                dtype=np.float64, count=num_candidates
+            )
+            education_scores = np.minimum(education_levels / required_level, 1.0)
+        
+        location_scores = np.fromiter(
+            (self._score_location(location, job_location_lower, job_location_words) for location in candidate_locations),
+            dtype=np.float64, count=num_candidates
+        )
+        
+        scores = {
+            'overall_score': self._weighted_score(skill_scores, experience_scores, education_scores, location_scores),
+            'skill_score': skill_scores,
+            'experience_score': experience_scores,
+            'education_score': education_scores,
+            'location_score': location_scores
+        }
         
-        matched = list(set(candidate_skill_names) & set(required_skill_names))
-        return matched
+        return _BatchScores(
+            scores, self._skill_bits(required_skill_names), candidate_skill_names,
+            experience_years, highest_education, job_location_lower, candidate_locations
+        )
     
     def rank_candidates(self, candidates: List[Dict[str, Any]], job: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Rank candidates by match score for a job"""
         scored_candidates = []
-        
-        for candidate in candidates:
-            match_result = self.calculate_match_score(candidate, job)
+        num_candidates = len(candidates)
+        
+        batch = self._score_batch(candidates, job)
+        scores = batch.scores
+        required_skill_bits = batch.required_skill_bits
+        
+        for i, candidate in enumerate(candidates):
+            match_result = self._build_match_result(
+                float(scores['overall_score'][i]), float(scores['skill_score'][i]),
+                float(scores['experience_score'][i]), float(scores['education_score'][i]),
+                float(scores['location_score'][i]),
+                float(batch.experience_years[i]), batch.highest_education[i][1],
+                self._skills_in_mask(self._skill_mask(batch.candidate_skill_names[i], required_skill_bits), required_skill_bits),
+                self._describe_distance(batch.candidate_locations[i], batch.job_location_lower)
+            )
             scored_candidates.append({
                 'candidate': candidate,
                 'match_score': match_result['overall_score'],
                 'match_details': match_result
             })
         
-        # Sort by match score (descending)
-        scored_candidates.sort(key=lambda x: x['match_score'], reverse=True)
+        # Sort by the rounded match score (descending); the stable argsort keeps
+        # input order among ties, like list.sort(reverse=True)
+        match_scores = np.fromiter(
+            (scored['match_score'] for scored in scored_candidates),
+            dtype=np.float64, count=num_candidates
+        )
+        order = np.argsort(-match_scores, kind='stable')
         
-        return scored_candidates
\ No newline at end of file
+        return [scored_candidates[i] for i in order]
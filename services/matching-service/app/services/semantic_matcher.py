@@ -5,164 +5,372 @@ Requirements: 3.4
 """
 
 import math
+import sys
+from functools import lru_cache, partial
+from types import MappingProxyType
 from typing import Dict, List, Set, Tuple, Any
 import logging
 
+import numpy as np
+
+# SIMD cosine kernels; NumPy is used when simsimd is not installed
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    SIMSIMD_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+def _interned(table: Dict[str, Tuple[str, ...]]) -> MappingProxyType:
+    """Read-only skill table with every skill name interned"""
+    return MappingProxyType({
+        sys.intern(skill): tuple(sys.intern(entry) for entry in entries)
+        for skill, entries in table.items()
+    })
+
+@lru_cache(maxsize=4096)
+def _lower(skill: str) -> str:
+    """Lowercase a skill name; interned so lookups in the interned tables hit the identity fast path"""
+    return sys.intern(skill.lower())
+
+# Skill categories reported by get_skill_context
+_CATEGORIES = {
+    'programming': ['python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust'],
+    'web': ['react', 'angular', 'vue', 'html', 'css', 'django', 'flask', 'express'],
+    'database': ['mysql', 'postgresql', 'mongodb', 'redis', 'sql', 'nosql'],
+    'cloud': ['aws', 'azure', 'gcp', 'docker', 'kubernetes'],
+    'data': ['pandas', 'numpy', 'tensorflow', 'pytorch', 'machine learning']
+}
+
+# Reverse lookup; each skill is listed under a single category
+_SKILL_TO_CATEGORY = {sys.intern(skill): category for category, skills in _CATEGORIES.items() for skill in skills}
+
+def _create_simple_embeddings() -> Dict[str, Tuple[float, ...]]:
+    """Create simple skill embeddings based on categories and relationships"""
+    embeddings = {}
+    
+    # Programming languages cluster
+    prog_langs = ['python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust']
+    for i, lang in enumerate(prog_langs):
+        embeddings[lang] = (1.0, 0.8, 0.0, 0.0, i * 0.1)
+    
+    # Web frameworks cluster
+    web_frameworks = ['react', 'angular', 'vue', 'django', 'flask', 'express', 'spring']
+    for i, framework in enumerate(web_frameworks):
+        embeddings[framework] = (0.8, 1.0, 0.2, 0.0, i * 0.1)
+    
+    # Databases cluster
+    databases = ['mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch']
+    for i, db in enumerate(databases):
+        embeddings[db] = (0.0, 0.2, 1.0, 0.0, i * 0.1)
+    
+    # Cloud/DevOps cluster
+    cloud_tools = ['aws', 'azure', 'docker', 'kubernetes', 'jenkins', 'terraform']
+    for i, tool in enumerate(cloud_tools):
+        embeddings[tool] = (0.0, 0.0, 0.2, 1.0, i * 0.1)
+    
+    # Data science cluster
+    data_tools = ['pandas', 'numpy', 'tensorflow', 'pytorch', 'scikit-learn']
+    for i, tool in enumerate(data_tools):
+        embeddings[tool] = (0.6, 0.0, 0.0, 0.0, 1.0 + i * 0.1)
+    
+    return embeddings
+
+# Skill tables and the indexes derived from them are built once at import and
+# shared read-only by every SemanticMatcher instance
+
+# Skill synonyms and related terms
+_SKILL_SYNONYMS = _interned({
+    'javascript': ('js', 'ecmascript', 'node.js', 'nodejs'),
+    'python': ('py', 'python3', 'python2'),
+    'react': ('reactjs', 'react.js'),
+    'angular': ('angularjs', 'angular.js'),
+    'vue': ('vuejs', 'vue.js'),
+    'database': ('db', 'databases', 'data storage'),
+    'sql': ('mysql', 'postgresql', 'sqlite', 'mssql'),
+    'nosql': ('mongodb', 'cassandra', 'dynamodb'),
+    'cloud': ('aws', 'azure', 'gcp', 'google cloud'),
+    'devops': ('ci/cd', 'deployment', 'infrastructure'),
+    'machine learning': ('ml', 'ai', 'artificial intelligence'),
+    'data science': ('analytics', 'statistics', 'data analysis'),
+    'frontend': ('front-end', 'ui', 'user interface'),
+    'backend': ('back-end', 'server-side', 'api'),
+    'fullstack': ('full-stack', 'full stack')
+})
+
+# Inverted synonym index: every canonical skill and synonym maps to its canonical
+_SYNONYM_CANONICAL = MappingProxyType({
+    **{canonical: canonical for canonical in _SKILL_SYNONYMS},
+    **{synonym: canonical for canonical, synonyms in _SKILL_SYNONYMS.items() for synonym in synonyms}
+})
+
+# Synonym group id per skill: skills sharing a canonical share an id, so a synonym
+# check over many pairs is one integer comparison
+_SYNONYM_CLASS = MappingProxyType({
+    skill: class_id
+    for class_id, canonical in enumerate(_SKILL_SYNONYMS)
+    for skill in (canonical, *_SKILL_SYNONYMS[canonical])
+    if _SYNONYM_CANONICAL[skill] == canonical
+})
+
+# Skill relationships (related skills)
+_SKILL_RELATIONSHIPS = _interned({
+    'react': ('javascript', 'jsx', 'redux', 'webpack'),
+    'angular': ('typescript', 'javascript', 'rxjs'),
+    'vue': ('javascript', 'vuex', 'nuxt'),
+    'django': ('python', 'orm', 'mvc'),
+    'flask': ('python', 'jinja2', 'werkzeug'),
+    'spring': ('java', 'mvc', 'dependency injection'),
+    'express': ('javascript', 'node.js', 'middleware'),
+    'tensorflow': ('python', 'machine learning', 'neural networks'),
+    'pytorch': ('python', 'machine learning', 'deep learning'),
+    'pandas': ('python', 'data analysis', 'numpy'),
+    'numpy': ('python', 'scientific computing', 'arrays'),
+    'docker': ('containerization', 'devops', 'kubernetes'),
+    'kubernetes': ('docker', 'orchestration', 'devops'),
+    'aws': ('cloud', 'ec2', 's3', 'lambda'),
+    'azure': ('cloud', 'microsoft', 'devops'),
+    'git': ('version control', 'github', 'gitlab')
+})
+
+# Related pairs in both orientations, so one set lookup covers either direction
+_RELATED_PAIRS = frozenset(
+    pair
+    for skill, related_skills in _SKILL_RELATIONSHIPS.items()
+    for related in related_skills
+    for pair in ((skill, related), (related, skill))
+)
+
+# The same pairs as a dense boolean adjacency over every skill in a relationship, so
+# relationships for a whole block of pairs come out of one fancy-indexing step
+_RELATED_INDEX = MappingProxyType({
+    skill: i for i, skill in enumerate(sorted({skill for pair in _RELATED_PAIRS for skill in pair}))
+})
+_RELATED_MATRIX = np.zeros((len(_RELATED_INDEX), len(_RELATED_INDEX)), dtype=bool)
+for _skill, _related in _RELATED_PAIRS:
+    _RELATED_MATRIX[_RELATED_INDEX[_skill], _RELATED_INDEX[_related]] = True
+_RELATED_MATRIX.setflags(write=False)
+
+# Simple word embeddings (in production, use pre-trained embeddings)
+_EMBEDDINGS = MappingProxyType({
+    sys.intern(skill): vector for skill, vector in _create_simple_embeddings().items()
+})
+
+def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize each row; all-zero rows stay zero"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+def _aligned_empty(shape: Tuple[int, int], dtype: Any, alignment: int = 64) -> np.ndarray:
+    """Uninitialized C-contiguous array whose data starts on an alignment-byte boundary"""
+    dtype = np.dtype(dtype)
+    size = shape[0] * shape[1] * dtype.itemsize
+    buffer = np.empty(size + alignment, dtype=np.uint8)
+    offset = -buffer.ctypes.data % alignment
+    return buffer[offset:offset + size].view(dtype).reshape(shape)
+
+def _embedding_table(embeddings: Dict[str, Tuple[float, ...]]) -> np.ndarray:
+    """Unit embedding rows in one aligned float32 buffer, in the order of embeddings"""
+    vectors = list(embeddings.values())
+    matrix = _aligned_empty((len(vectors), len(vectors[0])), np.float32)
+    matrix[:] = _unit_rows(np.array(vectors, dtype=np.float64))
+    return matrix
+
+# Embeddings stacked into one float32 matrix of unit rows, so cosine similarity is a plain
+# dot product over contiguous, cache-line aligned rows
+_EMBEDDING_INDEX = MappingProxyType({skill: i for i, skill in enumerate(_EMBEDDINGS)})
+_EMBEDDING_MATRIX = _embedding_table(_EMBEDDINGS)
+_EMBEDDING_MATRIX.setflags(write=False)
+
+# Row views per skill, so a pairwise lookup does not re-slice the matrix on every call
+_EMBEDDING_VECTORS = MappingProxyType({skill: _EMBEDDING_MATRIX[i] for skill, i in _EMBEDDING_INDEX.items()})
+
+# Symmetric int8 quantization of the unit rows, a quarter of the float32 footprint
+_QUANTIZED_MATRIX = np.rint(_EMBEDDING_MATRIX * (127.0 / np.max(np.abs(_EMBEDDING_MATRIX)))).astype(np.int8)
+_QUANTIZED_MATRIX.setflags(write=False)
+_QUANTIZED_VECTORS = MappingProxyType({skill: _QUANTIZED_MATRIX[i] for skill, i in _EMBEDDING_INDEX.items()})
+
 class SemanticMatcher:
     """Semantic skill matching with embeddings and synonyms"""
     
-    def __init__(self):
-        """Initialize semantic matcher"""
-        # Skill synonyms and related terms
-        self.skill_synonyms = {
-            'javascript': ['js', 'ecmascript', 'node.js', 'nodejs'],
-            'python': ['py', 'python3', 'python2'],
-            'react': ['reactjs', 'react.js'],
-            'angular': ['angularjs', 'angular.js'],
-            'vue': ['vuejs', 'vue.js'],
-            'database': ['db', 'databases', 'data storage'],
-            'sql': ['mysql', 'postgresql', 'sqlite', 'mssql'],
-            'nosql': ['mongodb', 'cassandra', 'dynamodb'],
-            'cloud': ['aws', 'azure', 'gcp', 'google cloud'],
-            'devops': ['ci/cd', 'deployment', 'infrastructure'],
-            'machine learning': ['ml', 'ai', 'artificial intelligence'],
-            'data science': ['analytics', 'statistics', 'data analysis'],
-            'frontend': ['front-end', 'ui', 'user interface'],
-            'backend': ['back-end', 'server-side', 'api'],
-            'fullstack': ['full-stack', 'full stack']
-        }
-        
-        # Skill relationships (related skills)
-        self.skill_relationships = {
-            'react': ['javascript', 'jsx', 'redux', 'webpack'],
-            'angular': ['typescript', 'javascript', 'rxjs'],
-            'vue': ['javascript', 'vuex', 'nuxt'],
-            'django': ['python', 'orm', 'mvc'],
-            'flask': ['python', 'jinja2', 'werkzeug'],
-            'spring': ['java', 'mvc', 'dependency injection'],
-            'express': ['javascript', 'node.js', 'middleware'],
-            'tensorflow': ['python', 'machine learning', 'neural networks'],
-            'pytorch': ['python', 'machine learning', 'deep learning'],
-            'pandas': ['python', 'data analysis', 'numpy'],
-            'numpy': ['python', 'scientific computing', 'arrays'],
-            'docker': ['containerization', 'devops', 'kubernetes'],
-            'kubernetes': ['docker', 'orchestration', 'devops'],
-            'aws': ['cloud', 'ec2', 's3', 'lambda'],
-            'azure': ['cloud', 'microsoft', 'devops'],
-            'git': ['version control', 'github', 'gitlab']
-        }
-        
-        # Simple word embeddings (in production, use pre-trained embeddings)
-        self.embeddings = self._create_simple_embeddings()
+    __slots__ = (
+        'skill_synonyms', 'skill_relationships', 'embeddings',
+        '_synonym_canonical', '_synonym_class', '_related_pairs', '_related_index', '_related_matrix',
+        '_embedding_index', '_quantized', '_embedding_matrix', '_embedding_vectors',
+        '_cached_similarity', '_cached_enhanced_match', '_cached_expansion'
+    )
+    
+    def __init__(self, quantize_embeddings: bool = False):
+        """Initialize semantic matcher.
+        
+        With quantize_embeddings, embedding similarity is computed from the int8 copy
+        of the table, trading about 1e-2 of accuracy for memory bandwidth.
+        """
+        self.skill_synonyms = _SKILL_SYNONYMS
+        self.skill_relationships = _SKILL_RELATIONSHIPS
+        self.embeddings = _EMBEDDINGS
+        
+        self._synonym_canonical = _SYNONYM_CANONICAL
+        self._synonym_class = _SYNONYM_CLASS
+        self._related_pairs = _RELATED_PAIRS
+        self._related_index = _RELATED_INDEX
+        self._related_matrix = _RELATED_MATRIX
+        self._embedding_index = _EMBEDDING_INDEX
+        self._quantized = quantize_embeddings
+        if quantize_embeddings:
+            self._embedding_matrix = _QUANTIZED_MATRIX
+            self._embedding_vectors = _QUANTIZED_VECTORS
+        else:
+            self._embedding_matrix = _EMBEDDING_MATRIX
+            self._embedding_vectors = _EMBEDDING_VECTORS
+        
+        # Per-instance memo of pairwise similarity over lowercased skills
+        self._cached_similarity = lru_cache(maxsize=8192)(self._compute_similarity)
+        
+        # Per-instance memo of enhanced matches, keyed by the lowercased skill lists; the same
+        # job is matched against many candidates and the same candidate against many jobs
+        self._cached_enhanced_match = lru_cache(maxsize=1024)(self._compute_enhanced_match)
+        
+        # Per-instance memo of expansions per required skill; job postings reuse common skills
+        self._cached_expansion = lru_cache(maxsize=4096)(self._expand_skill)
         
         logger.info("Semantic matcher initialized")
     
-    def _create_simple_embeddings(self) -> Dict[str, List[float]]:
-        """Create simple skill embeddings based on categories and relationships"""
-        embeddings = {}
-        
-        # Programming languages cluster
-        prog_langs = ['python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust']
-        for i, lang in enumerate(prog_langs):
-            embeddings[lang] = [1.0, 0.8, 0.0, 0.0, i * 0.1]
-        
-        # Web frameworks cluster
-        web_frameworks = ['react', 'angular', 'vue', 'django', 'flask', 'express', 'spring']
-        for i, framework in enumerate(web_frameworks):
-            embeddings[framework] = [0.8, 1.0, 0.2, 0.0, i * 0.1]
-        
-        # Databases cluster
-        databases = ['mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch']
-        for i, db in enumerate(databases):
-            embeddings[db] = [0.0, 0.2, 1.0, 0.0, i * 0.1]
-        
-        # Cloud/DevOps cluster
-        cloud_tools = ['aws', 'azure', 'docker', 'kubernetes', 'jenkins', 'terraform']
-        for i, tool in enumerate(cloud_tools):
-            embeddings[tool] = [0.0, 0.0, 0.2, 1.0, i * 0.1]
-        
-        # Data science cluster
-        data_tools = ['pandas', 'numpy', 'tensorflow', 'pytorch', 'scikit-learn']
-        for i, tool in enumerate(data_tools):
-            embeddings[tool] = [0.6, 0.0, 0.0, 0.0, 1.0 + i * 0.1]
-        
-        return embeddings
+    def clear_cache(self):
+        """Drop memoized pairwise similarities, enhanced matches and skill expansions"""
+        self._cached_similarity.cache_clear()
+        self._cached_enhanced_match.cache_clear()
+        self._cached_expansion.cache_clear()
     
     def calculate_semantic_similarity(self, skill1: str, skill2: str) -> float:
         """Calculate semantic similarity between two skills"""
-        skill1_lower = skill1.lower()
-        skill2_lower = skill2.lower()
+        return self._similarity_lower(_lower(skill1), _lower(skill2))
+    
+    def _similarity_lower(self, skill1: str, skill2: str) -> float:
+        """Cached similarity between two lowercased skills"""
+        # Similarity is symmetric, so both argument orders share one cache entry
+        if skill2 < skill1:
+            skill1, skill2 = skill2, skill1
+        return self._cached_similarity(skill1, skill2)
+    
+    def _compute_similarity(self, skill1: str, skill2: str) -> float:
+        """Compute similarity between two lowercased skills"""
+        # Cheapest checks first: exact, synonym and relationship are set and dict lookups
+        rule_score = self._rule_similarity(skill1, skill2)
+        if rule_score > 0:
+            return rule_score
+        
+        # Skills without an embedding never reach the cosine kernel
+        if skill1 not in self._embedding_index or skill2 not in self._embedding_index:
+            return 0.0
         
+        # Use embeddings for similarity
+        return self._embedding_similarity(skill1, skill2)
+    
+    def _rule_similarity(self, skill1: str, skill2: str) -> float:
+        """Similarity from exact, synonym and relationship rules; 0.0 if none applies"""
         # Exact match
-        if skill1_lower == skill2_lower:
+        if skill1 == skill2:
             return 1.0
         
         # Check synonyms
-        synonym_score = self._check_synonyms(skill1_lower, skill2_lower)
+        synonym_score = self._check_synonyms(skill1, skill2)
         if synonym_score > 0:
             return synonym_score
         
         # Check relationships
-        relationship_score = self._check_relationships(skill1_lower, skill2_lower)
-        if relationship_score > 0:
-            return relationship_score
-        
-        # Use embeddings for similarity
-        embedding_score = self._embedding_similarity(skill1_lower, skill2_lower)
-        
-        return embedding_score
+        return self._check_relationships(skill1, skill2)
     
     def _check_synonyms(self, skill1: str, skill2: str) -> float:
         """Check if skills are synonyms"""
-        for canonical, synonyms in self.skill_synonyms.items():
-            if (skill1 == canonical and skill2 in synonyms) or \
-               (skill2 == canonical and skill1 in synonyms) or \
-               (skill1 in synonyms and skill2 in synonyms):
-                return 0.95  # High similarity for synonyms
+        canonical = self._synonym_canonical.get(skill1)
+        if canonical is None or canonical != self._synonym_canonical.get(skill2):
+            return 0.0
         
-        return 0.0
+        # A canonical skill is not listed as its own synonym
+        if skill1 == skill2 == canonical:
+            return 0.0
+        
+        return 0.95  # High similarity for synonyms
     
     def _check_relationships(self, skill1: str, skill2: str) -> float:
         """Check if skills are related"""
-        # Check if skill1 is related to skill2
-        if skill1 in self.skill_relationships:
-            if skill2 in self.skill_relationships[skill1]:
-                return 0.7  # Moderate similarity for related skills
-        
-        # Check if skill2 is related to skill1
-        if skill2 in self.skill_relationships:
-            if skill1 in self.skill_relationships[skill2]:
-                return 0.7
+        if (skill1, skill2) in self._related_pairs:
+            return 0.7  # Moderate similarity for related skills
         
         return 0.0
     
     def _embedding_similarity(self, skill1: str, skill2: str) -> float:
         """Calculate similarity using embeddings"""
-        if skill1 not in self.embeddings or skill2 not in self.embeddings:
+        vector1 = self._embedding_vectors.get(skill1)
+        vector2 = self._embedding_vectors.get(skill2)
+        if vector1 is None or vector2 is None:
             return 0.0
         
-        vec1 = self.embeddings[skill1]
-        vec2 = self.embeddings[skill2]
+        return max(0.0, self._cosine(vector1, vector2))  # Ensure non-negative
+    
+    def _cosine(self, vector1: np.ndarray, vector2: np.ndarray) -> float:
+        """Cosine similarity of two embedding rows"""
+        if SIMSIMD_AVAILABLE:
+            return 1.0 - float(simsimd.cosine(vector1, vector2))
+        
+        if self._quantized:
+            # Quantized rows are only approximately unit length
+            vector1 = vector1.astype(np.int32)
+            vector2 = vector2.astype(np.int32)
+            magnitudes = math.sqrt(float(vector1 @ vector1) * float(vector2 @ vector2))
+            return float(vector1 @ vector2) / magnitudes if magnitudes else 0.0
+        
+        # Float rows are unit length
+        return float(vector1 @ vector2)
+    
+    def _cosine_matrix(self, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        """Cosine similarity of every row of left against every row of right"""
+        if SIMSIMD_AVAILABLE:
+            return 1.0 - np.asarray(simsimd.cdist(left, right, metric='cosine'), dtype=np.float64)
+        
+        if self._quantized:
+            left = left.astype(np.int32)
+            right = right.astype(np.int32)
+            magnitudes = np.sqrt(np.outer(np.einsum('ij,ij->i', left, left), np.einsum('ij,ij->i', right, right)))
+            return np.divide(left @ right.T, magnitudes, out=np.zeros(magnitudes.shape), where=magnitudes > 0)
+        
+        return left @ right.T
+    
+    def _embedding_similarities(self, target: str, pool: List[str]) -> np.ndarray:
+        """Embedding similarity of a lowercased target against a lowercased pool in one batch"""
+        return self._embedding_similarity_matrix([target], pool)[0]
+    
+    def _embedding_similarity_matrix(self, targets: List[str], pool: List[str]) -> np.ndarray:
+        """Embedding similarity of lowercased targets (rows) against a lowercased pool (columns)"""
+        similarities = np.zeros((len(targets), len(pool)))
         
-        # Cosine similarity
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        magnitude1 = math.sqrt(sum(a * a for a in vec1))
-        magnitude2 = math.sqrt(sum(a * a for a in vec2))
+        target_positions = [position for position, skill in enumerate(targets) if skill in self._embedding_index]
+        pool_positions = [position for position, skill in enumerate(pool) if skill in self._embedding_index]
+        if not target_positions or not pool_positions:
+            return similarities
         
-        if magnitude1 == 0 or magnitude2 == 0:
-            return 0.0
+        target_rows = np.array([self._embedding_index[targets[position]] for position in target_positions])
+        pool_rows = np.array([self._embedding_index[pool[position]] for position in pool_positions])
+        cosine = self._cosine_matrix(self._embedding_matrix[target_rows], self._embedding_matrix[pool_rows])
+        similarities[np.ix_(target_positions, pool_positions)] = np.clip(cosine, 0.0, 1.0)  # Ensure within [0, 1]
         
-        similarity = dot_product / (magnitude1 * magnitude2)
-        return max(0.0, similarity)  # Ensure non-negative
+        return similarities
     
     def find_similar_skills(self, target_skill: str, skill_pool: List[str], threshold: float = 0.5) -> List[Tuple[str, float]]:
         """Find skills similar to target skill from a pool"""
         similar_skills = []
         
-        for skill in skill_pool:
-            similarity = self.calculate_semantic_similarity(target_skill, skill)
+        target_lower = _lower(target_skill)
+        pool_lower = [_lower(skill) for skill in skill_pool]
+        
+        # Embedding scores for the whole pool at once; rule matches take precedence
+        embedding_scores = self._embedding_similarities(target_lower, pool_lower)
+        
+        for skill, skill_lower, embedding_score in zip(skill_pool, pool_lower, embedding_scores):
+            similarity = self._rule_similarity(target_lower, skill_lower) or float(embedding_score)
             if similarity >= threshold:
                 similar_skills.append((skill, similarity))
         
@@ -172,82 +380,165 @@ class SemanticMatcher:
         return similar_skills
     
     def expand_skill_requirements(self, required_skills: List[str]) -> Dict[str, List[Tuple[str, float]]]:
-        """Expand skill requirements with similar skills"""
-        expanded = {}
+        """Expand skill requirements with similar skills.
         
-        for skill in required_skills:
-            # Start with the original skill
-            expanded[skill] = [(skill, 1.0)]
-            
-            # Add synonyms
-            skill_lower = skill.lower()
-            for canonical, synonyms in self.skill_synonyms.items():
-                if skill_lower == canonical:
-                    for synonym in synonyms:
-                        expanded[skill].append((synonym, 0.95))
-                elif skill_lower in synonyms:
-                    expanded[skill].append((canonical, 0.95))
-                    for synonym in synonyms:
-                        if synonym != skill_lower:
-                            expanded[skill].append((synonym, 0.9))
-            
-            # Add related skills
-            if skill_lower in self.skill_relationships:
-                for related in self.skill_relationships[skill_lower]:
-                    expanded[skill].append((related, 0.7))
-        
-        return expanded
+        Each expanded skill appears once, with the highest score it was reached by.
+        """
+        return {skill: list(self._cached_expansion(skill)) for skill in required_skills}
+    
+    def _expand_skill(self, skill: str) -> Tuple[Tuple[str, float], ...]:
+        """Expansions of one required skill, starting with the skill itself"""
+        expansions = {skill: 1.0}
+        add = partial(self._add_expansion, expansions)
+        
+        # Add synonyms
+        skill_lower = _lower(skill)
+        canonical = self._synonym_canonical.get(skill_lower)
+        if canonical == skill_lower:
+            for synonym in self.skill_synonyms[canonical]:
+                add(synonym, 0.95)
+        elif canonical is not None:
+            add(canonical, 0.95)
+            for synonym in self.skill_synonyms[canonical]:
+                if synonym != skill_lower:
+                    add(synonym, 0.9)
+        
+        # Add related skills
+        for related in self.skill_relationships.get(skill_lower, ()):
+            add(related, 0.7)
+        
+        return tuple(expansions.items())
+    
+    @staticmethod
+    def _add_expansion(expansions: Dict[str, float], skill: str, score: float):
+        """Record an expanded skill, keeping its highest score"""
+        if expansions.get(skill, 0.0) < score:
+            expansions[skill] = score
+    
+    def get_known_skills(self) -> Set[str]:
+        """Get every skill that has synonyms, relationships or an embedding"""
+        known_skills = set(self.skill_synonyms) | set(self.skill_relationships) | set(self.embeddings)
+        for synonyms in self.skill_synonyms.values():
+            known_skills.update(synonyms)
+        return known_skills
     
     def calculate_enhanced_skill_match(self, candidate_skills: List[str], required_skills: List[str]) -> Dict[str, Any]:
         """Calculate enhanced skill match using semantic similarity"""
         if not required_skills:
             return {'score': 1.0, 'matches': [], 'partial_matches': []}
         
-        candidate_skills_lower = [skill.lower() for skill in candidate_skills]
-        required_skills_lower = [skill.lower() for skill in required_skills]
+        # Repeated candidate skills can never beat their first occurrence, so drop them
+        candidate_skills_lower = tuple(dict.fromkeys(_lower(skill) for skill in candidate_skills))
+        required_skills_lower = tuple(_lower(skill) for skill in required_skills)
+        
+        score, exact_matches, partial_matches, coverage = self._cached_enhanced_match(
+            candidate_skills_lower, required_skills_lower
+        )
+        
+        return {
+            'score': score,
+            'exact_matches': list(exact_matches),
+            'partial_matches': list(partial_matches),
+            'coverage': coverage
+        }
+    
+    def _compute_enhanced_match(self, candidate_skills_lower: Tuple[str, ...],
+                                required_skills_lower: Tuple[str, ...]) -> Tuple[float, Tuple[Dict[str, Any], ...], Tuple[Dict[str, Any], ...], float]:
+        """Enhanced match over distinct lowercased candidate skills and lowercased required skills.
+        
+        Results are memoized, so the match records are shared between calls and must not be mutated.
+        """
+        candidate_skill_set = set(candidate_skills_lower)
+        required_count = len(required_skills_lower)
         
         exact_matches = []
         partial_matches = []
         total_score = 0.0
         
-        for required_skill in required_skills_lower:
-            best_match = None
-            best_score = 0.0
-            
-            for candidate_skill in candidate_skills_lower:
-                similarity = self.calculate_semantic_similarity(required_skill, candidate_skill)
-                if similarity > best_score:
-                    best_score = similarity
-                    best_match = candidate_skill
-            
-            if best_score >= 0.9:
-                exact_matches.append({
+        # Score each distinct required skill once; repeated required skills reuse its record
+        best_by_required = {}
+        
+        # Only an exact match scores 1.0, so nothing else can beat it
+        unmatched = []
+        for required_skill in dict.fromkeys(required_skills_lower):
+            if required_skill in candidate_skill_set:
+                best_by_required[required_skill] = (1.0, required_skill)
+            else:
+                unmatched.append(required_skill)
+        
+        if unmatched and candidate_skills_lower:
+            similarities = self._similarity_matrix(unmatched, candidate_skills_lower)
+            best_positions = similarities.argmax(axis=1)
+            best_scores = similarities[np.arange(len(unmatched)), best_positions]
+            for required_skill, position, best_score in zip(unmatched, best_positions.tolist(), best_scores.tolist()):
+                best_match = candidate_skills_lower[position] if best_score > 0 else None
+                best_by_required[required_skill] = (best_score, best_match)
+        else:
+            for required_skill in unmatched:
+                best_by_required[required_skill] = (0.0, None)
+        
+        for required_skill, (best_score, best_match) in best_by_required.items():
+            match = None
+            if best_score >= 0.5:
+                match = {
                     'required': required_skill,
                     'candidate': best_match,
                     'similarity': best_score
-                })
+                }
+            best_by_required[required_skill] = (best_score, match)
+        
+        for required_skill in required_skills_lower:
+            best_score, match = best_by_required[required_skill]
+            
+            if best_score >= 0.9:
+                exact_matches.append(match)
             elif best_score >= 0.5:
-                partial_matches.append({
-                    'required': required_skill,
-                    'candidate': best_match,
-                    'similarity': best_score
-                })
+                partial_matches.append(match)
             
             total_score += best_score
         
-        # Calculate overall score
-        overall_score = total_score / len(required_skills) if required_skills else 1.0
-        
-        return {
-            'score': min(overall_score, 1.0),
-            'exact_matches': exact_matches,
-            'partial_matches': partial_matches,
-            'coverage': len(exact_matches) / len(required_skills) if required_skills else 1.0
-        }
+        # Every best score is within [0, 1], so the mean needs no clamping
+        return (
+            total_score / required_count,
+            tuple(exact_matches),
+            tuple(partial_matches),
+            len(exact_matches) / required_count
+        )
+    
+    def _similarity_matrix(self, targets: List[str], pool: List[str]) -> np.ndarray:
+        """Similarity of lowercased targets (rows) against a distinct lowercased pool (columns).
+        
+        Matches calculate_semantic_similarity cell for cell: rule scores replace the
+        embedding score wherever an exact, synonym or relationship rule applies.
+        """
+        similarities = self._embedding_similarity_matrix(targets, pool)
+        
+        # Relationships, with -1 for skills outside any relationship
+        target_rows = np.array([self._related_index.get(skill, -1) for skill in targets], dtype=np.int32)
+        pool_columns = np.array([self._related_index.get(skill, -1) for skill in pool], dtype=np.int32)
+        related = self._related_matrix[target_rows[:, np.newaxis], pool_columns]
+        related &= (target_rows >= 0)[:, np.newaxis] & (pool_columns >= 0)
+        similarities[related] = 0.7
+        
+        # Synonyms take precedence over relationships; one comparison of synonym class ids
+        # covers every pair, with -1 for skills outside any synonym group
+        target_classes = np.array([self._synonym_class.get(skill, -1) for skill in targets], dtype=np.int32)
+        pool_classes = np.array([self._synonym_class.get(skill, -1) for skill in pool], dtype=np.int32)
+        synonyms = (target_classes[:, np.newaxis] == pool_classes) & (target_classes >= 0)[:, np.newaxis]
+        similarities[synonyms] = 0.95
+        
+        # Exact matches take precedence over everything
+        positions = {skill: position for position, skill in enumerate(pool)}
+        for row, target in enumerate(targets):
+            position = positions.get(target)
+            if position is not None:
+                similarities[row, position] = 1.0
+        
+        return similarities
     
     def get_skill_context(self, skill: str) -> Dict[str, Any]:
         """Get contextual information about a skill"""
-        skill_lower = skill.lower()
+        skill_lower = _lower(skill)
         
         context = {
             'skill': skill,
@@ -258,32 +549,18 @@ class SemanticMatcher:
         }
         
         # Find synonyms
-        for canonical, synonyms in self.skill_synonyms.items():
-            if skill_lower == canonical:
-                context['synonyms'] = synonyms
-                break
-            elif skill_lower in synonyms:
-                context['synonyms'] = [canonical] + [s for s in synonyms if s != skill_lower]
-                break
+        canonical = self._synonym_canonical.get(skill_lower)
+        if canonical == skill_lower:
+            context['synonyms'] = list(self.skill_synonyms[canonical])
+        elif canonical is not None:
+            context['synonyms'] = [canonical] + [s for s in self.skill_synonyms[canonical] if s != skill_lower]
         
         # Find related skills
         if skill_lower in self.skill_relationships:
-            context['related_skills'] = self.skill_relationships[skill_lower]
+            context['related_skills'] = list(self.skill_relationships[skill_lower])
         
         return context
     
     def _get_skill_category(self, skill: str) -> str:
         """Determine the category of a skill"""
-        categories = {
-            'programming': ['python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust'],
-            'web': ['react', 'angular', 'vue', 'html', 'css', 'django', 'flask', 'express'],
-            'database': ['mysql', 'postgresql', 'mongodb', 'redis', 'sql', 'nosql'],
-            'cloud': ['aws', 'azure', 'gcp', 'docker', 'kubernetes'],
-            'data': ['pandas', 'numpy', 'tensorflow', 'pytorch', 'machine learning']
-        }
-        
-        for category, skills in categories.items():
-            if skill in skills:
-                return category
-        
-        return 'other'
\ No newline at end of file
+        return _SKILL_TO_CATEGORY.get(skill, 'other')
\ No newline at end of file
@@ -0,0 +1,12 @@
+"""
+Test configuration for matching service tests.
+"""
+
+import os
+
+from hypothesis import settings
+
+# Hypothesis profiles, picked with HYPOTHESIS_PROFILE; without it Hypothesis keeps its defaults
+settings.register_profile('ci', max_examples=50, deadline=None)
+settings.register_profile('dev', max_examples=20)
+settings.load_profile(os.getenv('HYPOTHESIS_PROFILE', 'default'))
@@ -7,15 +7,38 @@ Property test for matching score calculation.
 Feature: recruitment-testing-platform, Property 8: Matching Score Calculation
 """
 
+from types import MappingProxyType
+
 import pytest
 from hypothesis import given, strategies as st, assume
 
 from app.services.matching_engine import MatchingEngine
 
+# Skill and category vocabularies shared by the strategies below
+_SKILLS = ('python', 'java', 'javascript', 'react', 'sql', 'aws')
+_CANDIDATE_SKILLS = _SKILLS + ('cooking',)
+_CATEGORIES = ('programming', 'web', 'database', 'cloud')
+
 
 class TestMatchingScoreProperty:
     """Property tests for matching score calculation"""
     
+    # Fixed parts of the profiles in test_matching_score_bounds, shared by every example
+    _BASE_CANDIDATE = MappingProxyType({
+        'experience': [{'years': 3}],
+        'education': [{'degree': 'Bachelor'}],
+        'location': 'New York'
+    })
+    
+    _BASE_JOB = MappingProxyType({
+        'required_experience': 2,
+        'required_education': 'Bachelor',
+        'location': 'New York'
+    })
+    
+    # Component scores every match result carries
+    _SCORE_KEYS = ('overall_score', 'skill_score', 'experience_score', 'education_score', 'location_score')
+    
     def setup_method(self):
         """Set up test fixtures"""
         self.engine = MatchingEngine()
@@ -23,15 +46,15 @@ class TestMatchingScoreProperty:
     @given(
         candidate_skills=st.lists(
             st.fixed_dictionaries({
-                'skill': st.sampled_from(['python', 'java', 'javascript', 'react', 'sql', 'aws']),
-                'category': st.sampled_from(['programming', 'web', 'database', 'cloud']),
+                'skill': st.sampled_from(_SKILLS),
+                'category': st.sampled_from(_CATEGORIES),
                 'confidence': st.floats(min_value=0.1, max_value=1.0)
             }),
             min_size=0,
             max_size=10
         ),
         required_skills=st.lists(
-            st.sampled_from(['python', 'java', 'javascript', 'react', 'sql', 'aws']),
+            st.sampled_from(_SKILLS),
             min_size=0,
             max_size=8
         )
@@ -42,28 +65,15 @@ class TestMatchingScoreProperty:
         
         **Validates: Requirements 3.3**
         """
-        candidate = {
-            'skills': candidate_skills,
-            'experience': [{'years': 3}],
-            'education': [{'degree': 'Bachelor'}],
-            'location': 'New York'
-        }
-        
-        job = {
-            'required_skills': required_skills,
-            'required_experience': 2,
-            'required_education': 'Bachelor',
-            'location': 'New York'
-        }
+        candidate = {**self._BASE_CANDIDATE, 'skills': candidate_skills}
+        job = {**self._BASE_JOB, 'required_skills': required_skills}
         
         result = self.engine.calculate_match_score(candidate, job)
         
         # Property: All scores should be between 0 and 1
-        assert 0.0 <= result['overall_score'] <= 1.0, "Overall score should be between 0 and 1"
-        assert 0.0 <= result['skill_score'] <= 1.0, "Skill score should be between 0 and 1"
-        assert 0.0 <= result['experience_score'] <= 1.0, "Experience score should be between 0 and 1"
-        assert 0.0 <= result['education_score'] <= 1.0, "Education score should be between 0 and 1"
-        assert 0.0 <= result['location_score'] <= 1.0, "Location score should be between 0 and 1"
+        scores = {key: result[key] for key in self._SCORE_KEYS}
+        assert all(0.0 <= score <= 1.0 for score in scores.values()), \
+            f"All scores should be between 0 and 1: {scores}"
     
     def test_perfect_match_score(self):
         """
@@ -289,4 +299,93 @@ class TestMatchingScoreProperty:
                 f"Candidates should be ranked by descending match score: {current_score} >= {next_score}"
         
         # Property: All candidates should be included in ranking
-        assert len(ranked_candidates) == num_candidates, "All candidates should be included in ranking"
\ No newline at end of file
+        assert len(ranked_candidates) == num_candidates, "All candidates should be included in ranking"
+    
+    @given(
+        candidate_skill_lists=st.lists(
+            st.lists(
+                st.sampled_from(_CANDIDATE_SKILLS),
+                min_size=0,
+                max_size=6
+            ),
+            min_size=1,
+            max_size=8
+        ),
+        required_skills=st.lists(
+            st.sampled_from(_SKILLS),
+            min_size=0,
+            max_size=6
+        )
+    )
+    def test_batch_skill_match_equivalence(self, candidate_skill_lists, required_skills):
+        """
+        Property: Batch skill scoring should agree with per-candidate skill scoring.
+        
+        **Validates: Requirements 3.3**
+        """
+        candidates_skills = [
+            [{'skill': skill, 'category': 'programming', 'confidence': 0.8} for skill in skills]
+            for skills in candidate_skill_lists
+        ]
+        
+        batch_scores = self.engine.calculate_match_scores_batch(
+            [{'skills': skills} for skills in candidates_skills], {'required_skills': required_skills}
+        )['skill_score']
+        
+        assert len(batch_scores) == len(candidates_skills), "Batch should score every candidate"
+        for skills, batch_score in zip(candidates_skills, batch_scores):
+            # calculate_match_score rounds its component scores to 3 decimals
+            single_score = self.engine.calculate_match_score({'skills': skills}, {'required_skills': required_skills})['skill_score']
+            assert abs(batch_score - single_score) <= 5e-4 + 1e-9, \
+                f"Batch score {batch_score} should equal single score {single_score}"
+    
+    @given(
+        candidate_profiles=st.lists(
+            st.fixed_dictionaries({
+                'skills': st.lists(st.sampled_from(_CANDIDATE_SKILLS), max_size=6),
+                'years': st.integers(min_value=0, max_value=15),
+                'degree': st.sampled_from(['', 'High School', 'Bachelor', 'Master', 'PhD']),
+                'location': st.sampled_from(['', 'New York', 'Remote', 'San Francisco'])
+            }),
+            min_size=1,
+            max_size=8
+        ),
+        required_skills=st.lists(
+            st.sampled_from(_SKILLS),
+            min_size=0,
+            max_size=6
+        ),
+        required_years=st.integers(min_value=0, max_value=10),
+        required_education=st.sampled_from(['', 'Bachelor', 'Master', 'PhD'])
+    )
+    def test_batch_match_score_equivalence(self, candidate_profiles, required_skills, required_years, required_education):
+        """
+        Property: Batch match scoring should agree with per-candidate match scoring.
+        
+        **Validates: Requirements 3.3**
+        """
+        candidates = [
+            {
+                'skills': [{'skill': skill, 'category': 'programming', 'confidence': 0.8} for skill in profile['skills']],
+                'experience': [{'years': profile['years']}],
+                'education': [{'degree': profile['degree']}],
+                'location': profile['location']
+            }
+            for profile in candidate_profiles
+        ]
+        
+        job = {
+            'required_skills': required_skills,
+            'required_experience': required_years,
+            'required_education': required_education,
+            'location': 'New York'
+        }
+        
+        batch_scores = self.engine.calculate_match_scores_batch(candidates, job)
+        
+        for i, candidate in enumerate(candidates):
+            result = self.engine.calculate_match_score(candidate, job)
+            for key, column in batch_scores.items():
+                # Single results are rounded to 3 decimals
+                assert abs(column[i] - result[key]) <= 0.0005 + 1e-9, \
+                    f"Batch {key} {column[i]} should equal single {key} {result[key]}"
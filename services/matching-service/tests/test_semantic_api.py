@@ -0,0 +1,49 @@
+"""
+API tests for semantic skill expansion.
+"""
+
+from fastapi.testclient import TestClient
+
+from app.main import app, semantic_matcher
+
+
+class TestSkillExpansionAPI:
+    """Tests for the /semantic/expand endpoint"""
+    
+    def _spellings(self):
+        """Every skill the semantic matcher knows, in lower, upper and title case"""
+        return [
+            spelling
+            for skill in sorted(semantic_matcher.get_known_skills())
+            for spelling in (skill.lower(), skill.upper(), skill.title())
+        ]
+    
+    def _expected(self, skills):
+        """Uncached semantic matcher expansions, shaped as the JSON response returns them"""
+        expanded = semantic_matcher.expand_skill_requirements(skills)
+        return {
+            skill: [[related, score] for related, score in expansions]
+            for skill, expansions in expanded.items()
+        }
+    
+    def test_expansion_without_startup_cache(self, monkeypatch):
+        """Test that expansion falls back to the semantic matcher when startup has not run"""
+        # An earlier test in this process may have run the startup event
+        monkeypatch.delattr(app.state, 'expansion_cache', raising=False)
+        client = TestClient(app)
+        skills = self._spellings()
+        
+        response = client.post('/semantic/expand', json={'required_skills': skills})
+        
+        assert response.status_code == 200
+        assert response.json()['expanded_skills'] == self._expected(skills)
+    
+    def test_cached_expansion_matches_semantic_matcher(self):
+        """Test that expansions served from the startup cache match the semantic matcher"""
+        skills = self._spellings()
+        
+        with TestClient(app) as client:
+            response = client.post('/semantic/expand', json={'required_skills': skills})
+        
+        assert response.status_code == 200
+        assert response.json()['expanded_skills'] == self._expected(skills)
@@ -12,6 +12,10 @@ from hypothesis import given, strategies as st
 
 from app.services.semantic_matcher import SemanticMatcher
 
+# Skill vocabularies for the enhanced match strategies
+_CANDIDATE_SKILLS = ('python', 'javascript', 'react', 'java', 'aws', 'docker')
+_REQUIRED_SKILLS = ('python', 'js', 'reactjs', 'java', 'cloud', 'kubernetes')
+
 
 class TestSemanticMatchingProperty:
     """Property tests for semantic skill matching"""
@@ -123,12 +127,12 @@ class TestSemanticMatchingProperty:
     
     @given(
         candidate_skills=st.lists(
-            st.sampled_from(['python', 'javascript', 'react', 'java', 'aws', 'docker']),
+            st.sampled_from(_CANDIDATE_SKILLS),
             min_size=0,
             max_size=8
         ),
         required_skills=st.lists(
-            st.sampled_from(['python', 'js', 'reactjs', 'java', 'cloud', 'kubernetes']),
+            st.sampled_from(_REQUIRED_SKILLS),
             min_size=1,
             max_size=6
         )
@@ -242,4 +246,23 @@ class TestSemanticMatchingProperty:
             assert isinstance(context['synonyms'], list), "Synonyms should be a list"
             assert isinstance(context['related_skills'], list), "Related skills should be a list"
             assert isinstance(context['category'], str), "Category should be a string"
-            assert isinstance(context['embedding_available'], bool), "Embedding availability should be boolean"
\ No newline at end of file
+            assert isinstance(context['embedding_available'], bool), "Embedding availability should be boolean"
+    
+    @given(
+        skill1=st.sampled_from(['python', 'java', 'react', 'django', 'mysql', 'redis', 'aws', 'jenkins', 'pandas', 'pytorch']),
+        skill2=st.sampled_from(['javascript', 'go', 'vue', 'flask', 'mongodb', 'docker', 'terraform', 'numpy', 'scikit-learn'])
+    )
+    def test_quantized_embedding_similarity(self, skill1, skill2):
+        """
+        Property: Quantized embeddings should closely approximate full-precision similarity.
+        
+        **Validates: Requirements 3.4**
+        """
+        quantized_matcher = SemanticMatcher(quantize_embeddings=True)
+        
+        similarity = self.matcher.calculate_semantic_similarity(skill1, skill2)
+        quantized_similarity = quantized_matcher.calculate_semantic_similarity(skill1, skill2)
+        
+        assert 0.0 <= quantized_similarity <= 1.0, "Quantized similarity should be between 0 and 1"
+        assert abs(similarity - quantized_similarity) < 0.01, \
+            f"Quantized similarity {quantized_similarity} should be close to {similarity} for {skill1}-{skill2}"
@@ -0,0 +1 @@
+# Resume service package
\ No newline at end of file
@@ -5,10 +5,17 @@ FastAPI application for processing resumes and extracting structured data.
 Requirements: 2.1, 2.2, 2.3, 2.6, 2.7
 """
 
-from fastapi import FastAPI, File, UploadFile, HTTPException, status
+from fastapi import FastAPI, File, UploadFile, HTTPException, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Dict, Any
+from fastapi.responses import ORJSONResponse, Response
+from starlette.concurrency import run_in_threadpool
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Any
+import asyncio
+import io
 import logging
+import orjson
 
 from .services.nlp_service import NLPService
 from .services.document_processor import DocumentProcessor
@@ -20,7 +27,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Resume Parsing Service",
     description="Service for parsing resumes and extracting structured data",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -32,19 +40,76 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize services
-nlp_service = None
-document_processor = None
+# Services are built once per process on first use, then shared by every request
+@lru_cache(maxsize=1)
+def get_nlp_service() -> NLPService:
+    """Process-wide NLP service; loading the spaCy model happens here"""
+    return NLPService()
+
+@lru_cache(maxsize=1)
+def get_document_processor() -> DocumentProcessor:
+    """Process-wide document processor"""
+    return DocumentProcessor()
+
+# Largest accepted upload
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+
+# Most files accepted by /parse-batch
+MAX_BATCH_FILES = 20
+
+def _upload_stream(file: UploadFile) -> BinaryIO:
+    """Uploaded file as a binary stream at its start, rejecting oversized uploads.
+    
+    Uploads are already spooled to a temporary file (on disk past 1 MB), so the
+    stream is handed to the document processor instead of being read into memory.
+    """
+    stream = file.file
+    size = stream.seek(0, io.SEEK_END)
+    if size > MAX_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File exceeds the {MAX_UPLOAD_BYTES // (1024 * 1024)} MB upload limit"
+        )
+    stream.seek(0)
+    return stream
+
+def _parse_result(filename: str, doc_result: Dict[str, Any], extracted_data: Dict[str, Any],
+                  nlp_service: NLPService, document_processor: DocumentProcessor,
+                  include_raw: bool) -> Dict[str, Any]:
+    """Assemble a parse response from a processed document and its extracted entities"""
+    # Normalize skills
+    if extracted_data.get("skills"):
+        extracted_data["skills"] = nlp_service.normalize_skills(extracted_data["skills"])
+    
+    # Calculate confidence score
+    confidence_score = nlp_service.calculate_confidence_score(extracted_data)
+    
+    # Assess document quality
+    quality_assessment = document_processor.assess_quality(doc_result)
+    
+    result = {
+        "filename": filename,
+        "extracted_data": extracted_data,
+        "confidence_score": confidence_score,
+        "quality_assessment": quality_assessment,
+        "document_metadata": doc_result["metadata"]
+    }
+    if include_raw:
+        result["raw_text"] = _truncate(doc_result["text"])
+    
+    return result
+
+def _truncate(text: str, limit: int = 1000) -> str:
+    """First limit characters of text, marked with an ellipsis when cut"""
+    return f"{text[:limit]}..." if len(text) > limit else text
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize services on startup"""
-    global nlp_service, document_processor
-    
+    """Warm up services on startup so the first request does not pay for model loading"""
     try:
         logger.info("Initializing resume parsing services...")
-        nlp_service = NLPService()
-        document_processor = DocumentProcessor()
+        get_nlp_service()
+        get_document_processor()
         logger.info("Resume parsing services initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize services: {e}")
@@ -56,13 +121,18 @@ async def health_check():
     return {
         "status": "healthy",
         "service": "resume-parsing",
-        "nlp_ready": nlp_service is not None,
-        "processor_ready": document_processor is not None
+        "nlp_ready": get_nlp_service.cache_info().currsize > 0,
+        "processor_ready": get_document_processor.cache_info().currsize > 0
     }
 
 @app.post("/parse", response_model=Dict[str, Any])
-async def parse_resume(file: UploadFile = File(...)):
-    """Parse resume file and extract structured data"""
+async def parse_resume(
+    file: UploadFile = File(...),
+    include_raw: bool = True,
+    nlp_service: NLPService = Depends(get_nlp_service),
+    document_processor: DocumentProcessor = Depends(get_document_processor)
+):
+    """Parse resume file and extract structured data; include_raw=false omits the raw text excerpt"""
     
     if not file.filename:
         raise HTTPException(
@@ -71,11 +141,11 @@ async def parse_resume(file: UploadFile = File(...)):
         )
     
     try:
-        # Read file content
-        file_content = await file.read()
+        # Document parsing, OCR and NLP are blocking, so they run in the threadpool
+        # and the event loop keeps serving other requests meanwhile
         
-        # Process document to extract text
-        doc_result = document_processor.process_document(file_content, file.filename)
+        # Process the spooled upload to extract text
+        doc_result = await run_in_threadpool(document_processor.process_document, _upload_stream(file), file.filename)
         
         if not doc_result["metadata"]["success"]:
             raise HTTPException(
@@ -84,38 +154,99 @@ async def parse_resume(file: UploadFile = File(...)):
             )
         
         # Extract entities using NLP
-        extracted_data = nlp_service.extract_entities(doc_result["text"])
+        extracted_data = await run_in_threadpool(nlp_service.extract_entities, doc_result["text"])
         
-        # Normalize skills
-        if extracted_data.get("skills"):
-            extracted_data["skills"] = nlp_service.normalize_skills(extracted_data["skills"])
+        return _parse_result(file.filename, doc_result, extracted_data, nlp_service, document_processor, include_raw)
         
-        # Calculate confidence score
-        confidence_score = nlp_service.calculate_confidence_score(extracted_data)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error parsing resume {file.filename}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal server error: {str(e)}"
+        )
+
+@app.post("/parse-batch", response_model=Dict[str, Any])
+async def parse_resume_batch(
+    files: List[UploadFile] = File(...),
+    include_raw: bool = True,
+    nlp_service: NLPService = Depends(get_nlp_service),
+    document_processor: DocumentProcessor = Depends(get_document_processor)
+):
+    """Parse several resume files; entity extraction runs over all of them as one spaCy batch"""
+    
+    if len(files) > MAX_BATCH_FILES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_FILES} files per batch"
+        )
+    if not all(file.filename for file in files):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No filename provided"
+        )
+    
+    try:
+        streams = [_upload_stream(file) for file in files]
         
-        # Assess document quality
-        quality_assessment = document_processor.assess_quality(doc_result)
+        # Files of unsupported formats get an error entry instead of failing the batch
+        doc_results: List[Dict[str, Any]] = [
+            {"text": "", "metadata": {"filename": file.filename, "success": False,
+                                      "error": f"Unsupported file format: {Path(file.filename).suffix.lower()}"}}
+            for file in files
+        ]
+        supported = [
+            i for i, file in enumerate(files)
+            if Path(file.filename).suffix.lower() in document_processor.supported_formats
+        ]
+        
+        # Documents are processed concurrently in the threadpool
+        processed_docs = await asyncio.gather(*(
+            run_in_threadpool(document_processor.process_document, streams[i], files[i].filename)
+            for i in supported
+        ))
+        for i, doc_result in zip(supported, processed_docs):
+            doc_results[i] = doc_result
+        
+        processed = [i for i, doc_result in enumerate(doc_results) if doc_result["metadata"]["success"]]
+        extracted = await run_in_threadpool(
+            nlp_service.extract_entities_batch, [doc_results[i]["text"] for i in processed]
+        )
+        extracted_by_index = dict(zip(processed, extracted))
+        
+        results = []
+        for i, (file, doc_result) in enumerate(zip(files, doc_results)):
+            if i in extracted_by_index:
+                results.append(_parse_result(
+                    file.filename, doc_result, extracted_by_index[i], nlp_service, document_processor, include_raw
+                ))
+            else:
+                results.append({
+                    "filename": file.filename,
+                    "error": f"Failed to process document: {doc_result['metadata'].get('error', 'Unknown error')}"
+                })
         
         return {
-            "filename": file.filename,
-            "extracted_data": extracted_data,
-            "confidence_score": confidence_score,
-            "quality_assessment": quality_assessment,
-            "document_metadata": doc_result["metadata"],
-            "raw_text": doc_result["text"][:1000] + "..." if len(doc_result["text"]) > 1000 else doc_result["text"]
+            "results": results,
+            "count": len(results)
         }
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error parsing resume {file.filename}: {e}")
+        logger.error(f"Error parsing resume batch: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal server error: {str(e)}"
         )
 
 @app.post("/extract-skills", response_model=Dict[str, Any])
-async def extract_skills_only(file: UploadFile = File(...)):
+async def extract_skills_only(
+    file: UploadFile = File(...),
+    nlp_service: NLPService = Depends(get_nlp_service),
+    document_processor: DocumentProcessor = Depends(get_document_processor)
+):
     """Extract only skills from resume file"""
     
     if not file.filename:
@@ -125,9 +256,8 @@ async def extract_skills_only(file: UploadFile = File(...)):
         )
     
     try:
-        # Read and process file
-        file_content = await file.read()
-        doc_result = document_processor.process_document(file_content, file.filename)
+        # Process the spooled upload off the event loop
+        doc_result = await run_in_threadpool(document_processor.process_document, _upload_stream(file), file.filename)
         
         if not doc_result["metadata"]["success"]:
             raise HTTPException(
@@ -136,8 +266,8 @@ async def extract_skills_only(file: UploadFile = File(...)):
             )
         
         # Extract and normalize skills
-        skills = nlp_service._extract_skills(doc_result["text"])
-        normalized_skills = nlp_service.normalize_skills(skills)
+        skills = await run_in_threadpool(nlp_service._extract_skills, doc_result["text"])
+        normalized_skills = await run_in_threadpool(nlp_service.normalize_skills, skills)
         
         return {
             "filename": file.filename,
@@ -155,21 +285,29 @@ async def extract_skills_only(file: UploadFile = File(...)):
             detail=f"Internal server error: {str(e)}"
         )
 
+# Human-readable description of every format the service can support
+_FORMAT_DESCRIPTIONS = {
+    ".pdf": "PDF documents (text and scanned)",
+    ".docx": "Microsoft Word documents",
+    ".txt": "Plain text files",
+    ".png": "PNG images (OCR)",
+    ".jpg": "JPEG images (OCR)",
+    ".jpeg": "JPEG images (OCR)",
+    ".tiff": "TIFF images (OCR)"
+}
+
+@lru_cache(maxsize=1)
+def _supported_formats_body() -> bytes:
+    """Serialized /supported-formats response; the formats are fixed once the processor exists"""
+    return orjson.dumps({
+        "formats": list(get_document_processor().supported_formats),
+        "description": _FORMAT_DESCRIPTIONS
+    })
+
 @app.get("/supported-formats")
 async def get_supported_formats():
     """Get list of supported file formats"""
-    return {
-        "formats": list(document_processor.supported_formats),
-        "description": {
-            ".pdf": "PDF documents (text and scanned)",
-            ".docx": "Microsoft Word documents",
-            ".txt": "Plain text files",
-            ".png": "PNG images (OCR)",
-            ".jpg": "JPEG images (OCR)",
-            ".jpeg": "JPEG images (OCR)",
-            ".tiff": "TIFF images (OCR)"
-        }
-    }
+    return Response(content=_supported_formats_body(), media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
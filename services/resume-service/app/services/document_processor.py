@@ -5,16 +5,43 @@ Supports PDF, DOCX, TXT, and image files with OCR.
 Requirements: 2.1, 2.2, 2.3
 """
 
+import copy
+import hashlib
 import io
 import logging
-from typing import Dict, Any, Optional
+import multiprocessing
+import os
+import queue
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import BinaryIO, Callable, Dict, Iterable, Any, List, Optional, Tuple, Union
 from pathlib import Path
 
+import numpy as np
+
+# PDF text comes from PDFium when available, parsing content streams natively;
+# PyPDF2 remains a pure-Python fallback
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
 try:
     import PyPDF2
-    PDF_AVAILABLE = True
+    PYPDF2_AVAILABLE = True
+except ImportError:
+    PYPDF2_AVAILABLE = False
+
+PDF_AVAILABLE = PDFIUM_AVAILABLE or PYPDF2_AVAILABLE
+
+# Encoding detection for plain text that is not UTF-8; without it such text is read as Latin-1
+try:
+    from charset_normalizer import from_bytes
+    CHARSET_NORMALIZER_AVAILABLE = True
 except ImportError:
-    PDF_AVAILABLE = False
+    CHARSET_NORMALIZER_AVAILABLE = False
 
 try:
     from docx import Document
@@ -23,14 +50,61 @@ except ImportError:
     DOCX_AVAILABLE = False
 
 try:
-    import pytesseract
+    import PIL
     from PIL import Image
-    OCR_AVAILABLE = True
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+try:
+    import pytesseract
+    PYTESSERACT_AVAILABLE = True
+except ImportError:
+    PYTESSERACT_AVAILABLE = False
+
+# Tesseract's in-process API; without it pytesseract runs the tesseract binary per image
+try:
+    from tesserocr import PyTessBaseAPI
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+OCR_AVAILABLE = PIL_AVAILABLE and (TESSEROCR_AVAILABLE or PYTESSERACT_AVAILABLE)
+
+# Binarization ahead of Tesseract; without it images are recognized as uploaded
+try:
+    import cv2
+    CV2_AVAILABLE = True
 except ImportError:
-    OCR_AVAILABLE = False
+    CV2_AVAILABLE = False
+
+# GPU OCR engine, used instead of Tesseract when OCR_ENGINE=paddle
+try:
+    from paddleocr import PaddleOCR
+    PADDLEOCR_AVAILABLE = True
+except ImportError:
+    PADDLEOCR_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Adaptive threshold neighbourhood (odd, in pixels) and the constant subtracted from its weighted mean
+_THRESHOLD_BLOCK_SIZE = 31
+_THRESHOLD_OFFSET = 10
+
+# Documents a pool worker processes before it is replaced, releasing parser and OCR memory
+_WORKER_MAX_TASKS = 16
+
+# Distinct uploads whose processing results are kept per document processor
+_DOCUMENT_CACHE_SIZE = 1024
+
+# PDFium is not thread-safe, so threads in one process take turns with it;
+# process_documents spreads PDFs over processes instead
+_PDFIUM_LOCK = threading.Lock()
+
+def _default_workers() -> int:
+    """Pool size for batch processing; RESUME_WORKERS overrides one less than the CPU count"""
+    return int(os.environ.get("RESUME_WORKERS", max(1, (os.cpu_count() or 1) - 1)))
+
 class DocumentProcessor:
     """Service for processing various document formats"""
     
@@ -44,20 +118,90 @@ class DocumentProcessor:
             self.supported_formats.add('.docx')
         if OCR_AVAILABLE:
             self.supported_formats.update({'.png', '.jpg', '.jpeg', '.tiff'})
+            # Pillow-SIMD versions carry a .postN suffix, so this shows which build decodes images
+            logger.info(f"OCR image decoding uses Pillow {PIL.__version__}")
+        
+        # OCR engine for images: "tesseract", or "paddle" for PaddleOCR on the GPU
+        self._ocr_engine = os.environ.get("OCR_ENGINE", "tesseract").lower()
+        if self._ocr_engine == "paddle" and not PADDLEOCR_AVAILABLE:
+            logger.warning("OCR_ENGINE=paddle but paddleocr is not installed, using Tesseract")
+            self._ocr_engine = "tesseract"
+        
+        self._init_process_state()
             
         logger.info(f"Document processor initialized with formats: {self.supported_formats}")
     
-    def process_document(self, file_content: bytes, filename: str) -> Dict[str, Any]:
-        """Process document and extract text content"""
+    def _init_process_state(self):
+        """Set up state that belongs to one process and is never pickled"""
+        # Successful results keyed by a digest of the content and the extension;
+        # a resubmitted resume skips parsing and OCR
+        self._result_cache: "OrderedDict[Tuple[bytes, str], Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # The PaddleOCR engine is built on first use, so a CUDA context is never
+        # created before pool workers fork
+        self._paddle_ocr = None
+        self._ocr_lock = threading.Lock()
+        
+        # Idle in-process Tesseract APIs; one is created whenever every existing one is busy
+        self._tesseract_apis: "queue.SimpleQueue[PyTessBaseAPI]" = queue.SimpleQueue()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickled state for pool workers, which set up their own cache and OCR engine"""
+        state = self.__dict__.copy()
+        for name in ("_result_cache", "_cache_lock", "_paddle_ocr", "_ocr_lock", "_tesseract_apis"):
+            del state[name]
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]):
+        """Restore pickled state with fresh per-process state"""
+        self.__dict__.update(state)
+        self._init_process_state()
+    
+    @staticmethod
+    def _content_digest(file_content: Union[bytes, BinaryIO]) -> bytes:
+        """Digest of file content; a stream is read through and rewound to its start"""
+        if isinstance(file_content, bytes):
+            return hashlib.blake2b(file_content, digest_size=16).digest()
+        digest = hashlib.file_digest(file_content, lambda: hashlib.blake2b(digest_size=16)).digest()
+        file_content.seek(0)
+        return digest
+    
+    def process_document(self, file_content: Union[bytes, BinaryIO], filename: str) -> Dict[str, Any]:
+        """Process document and extract text content.
+        
+        file_content is either the raw bytes or a binary stream positioned at the start;
+        PDF, DOCX and image parsers read a stream directly without copying it into memory.
+        """
         file_ext = Path(filename).suffix.lower()
         
         if file_ext not in self.supported_formats:
             raise ValueError(f"Unsupported file format: {file_ext}")
         
+        key = (self._content_digest(file_content), file_ext)
+        with self._cache_lock:
+            result = self._result_cache.get(key)
+            if result is not None:
+                self._result_cache.move_to_end(key)
+        
+        if result is None:
+            result = self._process_uncached(file_content, filename, file_ext)
+            # Failures are not cached, so a transient error is retried on resubmission
+            if result["metadata"].get("success"):
+                with self._cache_lock:
+                    self._result_cache[key] = result
+                    if len(self._result_cache) > _DOCUMENT_CACHE_SIZE:
+                        self._result_cache.popitem(last=False)
+        
+        # Callers may modify the result, so never hand out the cached one
+        return copy.deepcopy(result)
+    
+    def _process_uncached(self, file_content: Union[bytes, BinaryIO], filename: str, file_ext: str) -> Dict[str, Any]:
+        """Process document content with the handler for its extension"""
         try:
             if file_ext == '.pdf':
                 if not PDF_AVAILABLE:
-                    raise ValueError("PDF processing not available - PyPDF2 not installed")
+                    raise ValueError("PDF processing not available - pypdfium2/PyPDF2 not installed")
                 return self._process_pdf(file_content)
             elif file_ext == '.docx':
                 if not DOCX_AVAILABLE:
@@ -67,7 +211,7 @@ class DocumentProcessor:
                 return self._process_txt(file_content)
             elif file_ext in {'.png', '.jpg', '.jpeg', '.tiff'}:
                 if not OCR_AVAILABLE:
-                    raise ValueError("Image processing not available - pytesseract/PIL not installed")
+                    raise ValueError("Image processing not available - tesserocr/pytesseract/PIL not installed")
                 return self._process_image(file_content)
             else:
                 raise ValueError(f"Handler not implemented for: {file_ext}")
@@ -84,25 +228,49 @@ class DocumentProcessor:
                 }
             }
     
-    def _process_pdf(self, file_content: bytes) -> Dict[str, Any]:
+    def process_documents(self, batch: List[Tuple[bytes, str]]) -> List[Dict[str, Any]]:
+        """Process (file_content, filename) pairs in a process pool, returning results in batch order.
+        
+        PDF parsing and OCR are CPU bound, so a batch spreads over RESUME_WORKERS processes;
+        a single document or a single worker is processed in this process.
+        """
+        workers = min(_default_workers(), len(batch))
+        if workers <= 1:
+            return [self.process_document(file_content, filename) for file_content, filename in batch]
+        
+        with multiprocessing.Pool(workers, maxtasksperchild=_WORKER_MAX_TASKS) as pool:
+            return pool.starmap(self.process_document, batch)
+    
+    @staticmethod
+    def _as_stream(file_content: Union[bytes, BinaryIO]) -> BinaryIO:
+        """Binary stream over file content, wrapping raw bytes"""
+        return io.BytesIO(file_content) if isinstance(file_content, bytes) else file_content
+    
+    def _process_pdf(self, file_content: Union[bytes, BinaryIO]) -> Dict[str, Any]:
         """Extract text from PDF file"""
         text = ""
         metadata = {"format": "pdf", "pages": 0, "success": True}
         
         try:
-            pdf_file = io.BytesIO(file_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            
-            metadata["pages"] = len(pdf_reader.pages)
+            pdf_file = self._as_stream(file_content)
             
-            for page_num, page in enumerate(pdf_reader.pages):
-                try:
-                    page_text = page.extract_text()
-                    text += page_text + "\n"
-                except Exception as e:
-                    logger.warning(f"Error extracting text from page {page_num}: {e}")
-                    metadata["warnings"] = metadata.get("warnings", [])
-                    metadata["warnings"].append(f"Page {page_num}: {str(e)}")
+            if PDFIUM_AVAILABLE:
+                with _PDFIUM_LOCK:
+                    pdf = pdfium.PdfDocument(pdf_file)
+                    try:
+                        metadata["pages"] = len(pdf)
+                        text = self._extract_pdf_pages(
+                            (partial(self._pdfium_page_text, pdf, page_num) for page_num in range(len(pdf))),
+                            metadata
+                        )
+                    finally:
+                        pdf.close()
+            else:
+                # Lenient parsing tolerates the malformed xrefs common in generated resumes, and
+                # one page list is reused since every .pages access builds a new one
+                pages = PyPDF2.PdfReader(pdf_file, strict=False).pages
+                metadata["pages"] = len(pages)
+                text = self._extract_pdf_pages((page.extract_text for page in pages), metadata)
             
             # If no text extracted, might be scanned PDF
             if not text.strip():
@@ -119,19 +287,48 @@ class DocumentProcessor:
             "metadata": metadata
         }
     
-    def _process_docx(self, file_content: bytes) -> Dict[str, Any]:
+    @staticmethod
+    def _extract_pdf_pages(page_extractors: Iterable[Callable[[], str]], metadata: Dict[str, Any]) -> str:
+        """Join the text returned by each page extractor, recording pages that fail as warnings"""
+        # Pages are joined once at the end; growing one string per page is quadratic in page count
+        page_texts = []
+        for page_num, extract_text in enumerate(page_extractors):
+            try:
+                page_texts.append(extract_text() or "")
+            except Exception as e:
+                logger.warning(f"Error extracting text from page {page_num}: {e}")
+                metadata["warnings"] = metadata.get("warnings", [])
+                metadata["warnings"].append(f"Page {page_num}: {str(e)}")
+        return "\n".join(page_texts)
+    
+    @staticmethod
+    def _pdfium_page_text(pdf: "pdfium.PdfDocument", page_num: int) -> str:
+        """Text of one page of a PDFium document, with PDFium's CRLF line breaks made LF"""
+        page = pdf[page_num]
+        try:
+            textpage = page.get_textpage()
+            try:
+                return textpage.get_text_range().replace("\r\n", "\n")
+            finally:
+                textpage.close()
+        finally:
+            page.close()
+    
+    def _process_docx(self, file_content: Union[bytes, BinaryIO]) -> Dict[str, Any]:
         """Extract text from DOCX file"""
         text = ""
         metadata = {"format": "docx", "paragraphs": 0, "success": True}
         
         try:
-            docx_file = io.BytesIO(file_content)
+            docx_file = self._as_stream(file_content)
             doc = Document(docx_file)
             
+            # Paragraph and cell text is rebuilt from the XML runs on every access, so read it once
             paragraphs = []
             for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    paragraphs.append(paragraph.text)
+                paragraph_text = paragraph.text
+                if paragraph_text.strip():
+                    paragraphs.append(paragraph_text)
             
             text = "\n".join(paragraphs)
             metadata["paragraphs"] = len(paragraphs)
@@ -142,8 +339,9 @@ class DocumentProcessor:
                 for row in table.rows:
                     row_text = []
                     for cell in row.cells:
-                        if cell.text.strip():
-                            row_text.append(cell.text.strip())
+                        cell_text = cell.text.strip()
+                        if cell_text:
+                            row_text.append(cell_text)
                     if row_text:
                         tables_text.append(" | ".join(row_text))
             
@@ -161,22 +359,22 @@ class DocumentProcessor:
             "metadata": metadata
         }
     
-    def _process_txt(self, file_content: bytes) -> Dict[str, Any]:
+    def _process_txt(self, file_content: Union[bytes, BinaryIO]) -> Dict[str, Any]:
         """Extract text from TXT file"""
         metadata = {"format": "txt", "success": True}
         
         try:
-            # Try different encodings
-            encodings = ['utf-8', 'latin-1', 'cp1252']
-            text = ""
+            # Plain text is decoded whole, so a stream is read into bytes here
+            if not isinstance(file_content, bytes):
+                file_content = file_content.read()
             
-            for encoding in encodings:
-                try:
-                    text = file_content.decode(encoding)
-                    metadata["encoding"] = encoding
-                    break
-                except UnicodeDecodeError:
-                    continue
+            # Most resumes are UTF-8, so that is tried first; anything else is decoded
+            # with the detected encoding in a single further pass
+            try:
+                text = file_content.decode('utf-8')
+                metadata["encoding"] = 'utf-8'
+            except UnicodeDecodeError:
+                text, metadata["encoding"] = self._decode_detected(file_content)
             
             if not text:
                 raise ValueError("Could not decode text file with any supported encoding")
@@ -192,30 +390,32 @@ class DocumentProcessor:
             "metadata": metadata
         }
     
-    def _process_image(self, file_content: bytes) -> Dict[str, Any]:
+    @staticmethod
+    def _decode_detected(file_content: bytes) -> Tuple[str, str]:
+        """Text and encoding of non-UTF-8 content, detected when possible and Latin-1 otherwise"""
+        if CHARSET_NORMALIZER_AVAILABLE:
+            best = from_bytes(file_content).best()
+            if best is not None:
+                return str(best), best.encoding
+        # Every byte sequence is valid Latin-1
+        return file_content.decode('latin-1'), 'latin-1'
+    
+    def _process_image(self, file_content: Union[bytes, BinaryIO]) -> Dict[str, Any]:
         """Extract text from image using OCR"""
         text = ""
         metadata = {"format": "image", "success": True, "ocr": True}
         
         try:
-            image = Image.open(io.BytesIO(file_content))
+            image = Image.open(self._as_stream(file_content))
             metadata["image_size"] = image.size
             metadata["image_mode"] = image.mode
             
             # Perform OCR
-            text = pytesseract.image_to_string(image)
-            
-            # Get OCR confidence if available
-            try:
-                ocr_data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
-                confidences = [int(conf) for conf in ocr_data['conf'] if int(conf) > 0]
-                if confidences:
-                    metadata["ocr_confidence"] = sum(confidences) / len(confidences)
-                else:
-                    metadata["ocr_confidence"] = 0
-            except Exception as e:
-                logger.warning(f"Could not get OCR confidence: {e}")
-                metadata["ocr_confidence"] = None
+            metadata["ocr_engine"] = self._ocr_engine
+            if self._ocr_engine == "paddle":
+                text, metadata["ocr_confidence"] = self._paddle_ocr_text(image)
+            else:
+                text, metadata["ocr_confidence"] = self._tesseract_text(image)
             
         except Exception as e:
             logger.error(f"Error processing image with OCR: {e}")
@@ -227,6 +427,91 @@ class DocumentProcessor:
             "metadata": metadata
         }
     
+    def _tesseract_text(self, image: "Image.Image") -> Tuple[str, float]:
+        """Recognized text of an image and its mean word confidence, using Tesseract.
+        
+        With tesserocr the image is recognized in process. Otherwise a single pytesseract
+        image_to_data pass yields both; the text is rebuilt from its words, one line per
+        Tesseract line with a blank line between paragraphs, as image_to_string would lay it out.
+        """
+        if CV2_AVAILABLE:
+            image = self._binarize(image)
+        
+        if TESSEROCR_AVAILABLE:
+            return self._tesserocr_text(image)
+        
+        ocr_data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
+        
+        lines: Dict[Tuple[int, int, int], List[str]] = {}
+        confidences = []
+        for word, conf, block_num, par_num, line_num in zip(
+            ocr_data['text'], ocr_data['conf'], ocr_data['block_num'], ocr_data['par_num'], ocr_data['line_num']
+        ):
+            # Rows for pages, blocks, paragraphs and lines carry no text and a confidence of -1
+            if word.strip():
+                lines.setdefault((block_num, par_num, line_num), []).append(word)
+            # Newer Tesseract versions report confidences as floats
+            if float(conf) > 0:
+                confidences.append(float(conf))
+        
+        text_lines = []
+        previous_paragraph = None
+        for (block_num, par_num, _), words in lines.items():
+            if previous_paragraph is not None and (block_num, par_num) != previous_paragraph:
+                text_lines.append("")
+            text_lines.append(" ".join(words))
+            previous_paragraph = (block_num, par_num)
+        
+        confidence = sum(confidences) / len(confidences) if confidences else 0
+        return "\n".join(text_lines), confidence
+    
+    def _tesserocr_text(self, image: "Image.Image") -> Tuple[str, float]:
+        """Recognized text of an image and its mean word confidence, using an idle in-process Tesseract API"""
+        try:
+            api = self._tesseract_apis.get_nowait()
+        except queue.Empty:
+            api = PyTessBaseAPI(lang="eng")
+        
+        try:
+            api.SetImage(image)
+            return api.GetUTF8Text(), api.MeanTextConf()
+        finally:
+            api.Clear()
+            self._tesseract_apis.put(api)
+    
+    @staticmethod
+    def _binarize(image: "Image.Image") -> "Image.Image":
+        """Grayscale, adaptively thresholded and lightly dilated copy of an image.
+        
+        Tesseract is faster and more accurate on clean black-on-white input than on
+        photos or scans with uneven lighting.
+        """
+        gray = np.asarray(image.convert("L"))
+        binary = cv2.adaptiveThreshold(
+            gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY,
+            _THRESHOLD_BLOCK_SIZE, _THRESHOLD_OFFSET
+        )
+        binary = cv2.dilate(binary, np.ones((2, 2), np.uint8), iterations=1)
+        return Image.fromarray(binary)
+    
+    def _paddle_ocr_text(self, image: "Image.Image") -> Tuple[str, float]:
+        """Recognized text of an image and its mean confidence on Tesseract's 0-100 scale, using PaddleOCR.
+        
+        PaddleOCR resizes on the GPU itself, so the image is only converted to the BGR
+        array it expects.
+        """
+        with self._ocr_lock:
+            if self._paddle_ocr is None:
+                self._paddle_ocr = PaddleOCR(use_gpu=True, lang="en", show_log=False)
+        
+        pixels = np.asarray(image.convert("RGB"))[:, :, ::-1]
+        # One result per page; a page without any text is None
+        lines = self._paddle_ocr.ocr(pixels)[0] or []
+        
+        text = "\n".join(line_text for _, (line_text, _) in lines)
+        confidences = [score * 100 for _, (_, score) in lines]
+        return text, sum(confidences) / len(confidences) if confidences else 0
+    
     def assess_quality(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """Assess the quality of extracted text"""
         text = result.get("text", "")
@@ -12,27 +12,119 @@ except ImportError:
     SPACY_AVAILABLE = False
     spacy = None
 
+# Multi-pattern skill scanning; without it each skill is searched for separately
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Near-duplicate skill grouping for long skill lists ("python" / "python3")
+try:
+    from datasketch import MinHash, MinHashLSH
+    DATASKETCH_AVAILABLE = True
+except ImportError:
+    DATASKETCH_AVAILABLE = False
+
+import copy
+import difflib
+import functools
+import hashlib
+import os
 import re
-from typing import Dict, List, Optional, Any
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Final, List, Optional, Any, Set, Tuple
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Distinct resume texts whose extraction results are kept per NLP service
+_EXTRACTION_CACHE_SIZE = 1024
+
+# Texts spaCy processes together in extract_entities_batch
+_SPACY_BATCH_SIZE = int(os.getenv("SPACY_BATCH_SIZE", "32"))
+
+# A skill only counts as a whole word: the characters around it must not be word characters,
+# so "r" or "go" are not found inside "docker" or "google"
+_WORD_CHAR = re.compile(r'\w')
+_WORD = re.compile(r'\w+')
+
+# Entity patterns, compiled once. Patterns within a group stay separate scans rather than
+# one alternation: a span matched by several of them is reported once per pattern
+_NAME_PATTERNS = (
+    re.compile(r'^([A-Z][a-z]+ [A-Z][a-z]+)', re.MULTILINE),  # First Last at start of line
+    re.compile(r'Name:?\s*([A-Z][a-z]+ [A-Z][a-z]+)', re.MULTILINE),  # Name: First Last
+)
+_EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_PATTERN = re.compile(r'(\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})')
+_DEGREE_PATTERNS = (
+    re.compile(r'(bachelor|master|phd|doctorate|associate).*?(?:degree|of|in)\s+([^\n]+)', re.IGNORECASE),
+    re.compile(r'(b\.?s\.?|m\.?s\.?|m\.?a\.?|ph\.?d\.?|b\.?a\.?)\s+(?:in\s+)?([^\n]+)', re.IGNORECASE),
+)
+_JOB_PATTERNS = (
+    re.compile(r'(software engineer|developer|analyst|manager|director|consultant|specialist)\s+(?:at\s+)?([^\n]+)', re.IGNORECASE),
+    re.compile(r'([A-Z][a-z]+\s+[A-Z][a-z]+)\s+(?:at\s+)?([A-Z][^\n]+)', re.IGNORECASE),
+)
+
+# Only entity recognition is used; excluded components are never loaded, which keeps
+# their weights out of memory. The small model's NER embeds its own tok2vec layer.
+_EXCLUDED_PIPES = ("tok2vec", "tagger", "parser", "senter", "attribute_ruler", "lemmatizer")
+
+# Skill lists longer than this after exact normalization are also grouped by near-duplicate
+# names; shorter lists are rarely worth the MinHash setup
+_FUZZY_DEDUP_MIN_SKILLS = 32
+# MinHash LSH over character 3-grams only proposes candidates, so its Jaccard threshold is
+# loose; a candidate is merged when its edit similarity reaches _FUZZY_DEDUP_SIMILARITY
+# ("mysql" and "sql" score 0.75 and stay apart)
+_MINHASH_LSH_THRESHOLD = 0.4
+_MINHASH_PERMUTATIONS = 128
+_FUZZY_DEDUP_SIMILARITY = 0.8
+
+# Simple normalization rules: canonical skill name and the aliases that map to it
+_SKILL_SYNONYMS: Final[Dict[str, Tuple[str, ...]]] = {
+    "javascript": ("JS",),
+    "typescript": ("TS",),
+    "python": ("Py",),
+    "node.js": ("Node", "NodeJS"),
+    "react": ("React.js", "ReactJS"),
+    "vue": ("Vue.js",),
+    "angular": ("Angular.js",),
+}
+
+# Flattened once at import so normalization is a single lookup keyed by lowercase alias
+_SKILL_NORMALIZATIONS: Final[Dict[str, str]] = {
+    alias.lower(): canonical
+    for canonical, aliases in _SKILL_SYNONYMS.items()
+    for alias in aliases
+}
+
+@functools.lru_cache(maxsize=2048)
+def _canonical_skill_name(skill: str) -> str:
+    """Canonical form of a skill name; resumes repeat the same few spellings"""
+    skill_lower = skill.lower()
+    return _SKILL_NORMALIZATIONS.get(skill_lower, skill_lower)
+
+@functools.lru_cache(maxsize=1)
+def _get_nlp() -> "spacy.language.Language":
+    """English spaCy pipeline, loaded once per process and shared by every NLP service"""
+    return spacy.load("en_core_web_sm", exclude=list(_EXCLUDED_PIPES))
+
 class NLPService:
     """Service for natural language processing of resume content"""
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize NLP service with spaCy model"""
         if not SPACY_AVAILABLE:
             logger.warning("spaCy not available, using fallback NLP processing")
             self.nlp = None
         else:
             try:
-                # Load English language model
-                self.nlp = spacy.load("en_core_web_sm")
+                # Load English language model, or reuse the one already loaded
+                self.nlp = _get_nlp()
                 
-                # Add custom patterns for resume entities
+                # Add custom patterns for resume entities (once, on the shared model)
                 self._add_custom_patterns()
                 
                 logger.info("NLP service initialized successfully with spaCy")
@@ -43,8 +135,74 @@ class NLPService:
         
         # Load skill taxonomy
         self.skill_taxonomy = self._load_skill_taxonomy()
+        
+        # Distinct (skill, category, lowercased skill) entries in taxonomy order, and an
+        # automaton that finds every taxonomy skill in a text in one scan
+        self._skill_entries = list(dict.fromkeys(
+            (skill, category, skill.lower())
+            for category, skills in self.skill_taxonomy.items()
+            for skill in skills
+        ))
+        if AHOCORASICK_AVAILABLE:
+            self._skill_automaton = self._build_skill_automaton()
+        else:
+            self._skill_automaton = None
+            # Without the automaton, a skill that is a single word is present exactly when it
+            # is one of the text's words, so most skills are found by set lookups; only
+            # skills with spaces or punctuation ("power bi", "c++", "node.js") need a regex
+            self._word_skill_indexes: Dict[str, List[int]] = {}
+            self._skill_patterns = []
+            for index, (_, _, skill_lower) in enumerate(self._skill_entries):
+                if _WORD.fullmatch(skill_lower):
+                    self._word_skill_indexes.setdefault(skill_lower, []).append(index)
+                else:
+                    self._skill_patterns.append(
+                        (index, re.compile(rf'(?<!\w){re.escape(skill_lower)}(?!\w)'))
+                    )
+        
+        # Extraction results keyed by a digest of the text; re-uploads of the same resume
+        # skip the model. Kept per instance, so a reloaded model starts with empty caches
+        self._entity_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._skill_cache: "OrderedDict[bytes, List[Dict[str, Any]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    @staticmethod
+    def _text_key(text: str) -> bytes:
+        """Cache key for a text"""
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
     
-    def _add_custom_patterns(self):
+    def _cache_store(self, cache: OrderedDict, key: bytes, result: Any) -> None:
+        """Add a result to an LRU cache, evicting the least recently used entry when full"""
+        with self._cache_lock:
+            cache[key] = result
+            if len(cache) > _EXTRACTION_CACHE_SIZE:
+                cache.popitem(last=False)
+    
+    def _memoized(self, cache: OrderedDict, text: str, compute: Callable[[str], Any]) -> Any:
+        """LRU-memoize compute(text) by a digest of text; every caller gets its own copy"""
+        key = self._text_key(text)
+        
+        with self._cache_lock:
+            result = cache.get(key)
+            if result is not None:
+                cache.move_to_end(key)
+        
+        if result is None:
+            result = compute(text)
+            self._cache_store(cache, key, result)
+        
+        # Callers mutate the result (e.g. normalizing skills in place), so never hand out the cached one
+        return copy.deepcopy(result)
+    
+    def _build_skill_automaton(self) -> "ahocorasick.Automaton":
+        """Aho-Corasick automaton over the lowercased taxonomy skills, yielding (entry index, length)"""
+        automaton = ahocorasick.Automaton()
+        for index, (_, _, skill_lower) in enumerate(self._skill_entries):
+            automaton.add_word(skill_lower, (index, len(skill_lower)))
+        automaton.make_automaton()
+        return automaton
+    
+    def _add_custom_patterns(self) -> None:
         """Add custom patterns for resume-specific entities"""
         if not self.nlp:
             return
@@ -93,99 +251,127 @@ class NLPService:
     
     def extract_entities(self, text: str) -> Dict[str, Any]:
         """Extract named entities from resume text"""
-        entities = {
-            "names": [],
-            "emails": [],
-            "phones": [],
-            "organizations": [],
-            "locations": [],
-            "dates": [],
-            "skills": [],
-            "education": [],
-            "experience": []
-        }
+        return self._memoized(self._entity_cache, text, self._extract_entities_uncached)
+    
+    def extract_entities_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Extract named entities from many resume texts, in order.
         
-        if self.nlp:
-            # Use spaCy for entity extraction
-            doc = self.nlp(text)
+        Texts missing from the cache go through spaCy as one nlp.pipe stream, which
+        batches the pipeline's work instead of running it once per document.
+        """
+        keys = [self._text_key(text) for text in texts]
+        
+        with self._cache_lock:
+            results = {}
+            for key in keys:
+                if key in self._entity_cache:
+                    self._entity_cache.move_to_end(key)
+                    results[key] = self._entity_cache[key]
+        
+        missing = {key: text for key, text in zip(keys, texts) if key not in results}
+        if missing:
+            if self.nlp:
+                docs = self.nlp.pipe(missing.values(), batch_size=_SPACY_BATCH_SIZE)
+            else:
+                docs = (None for _ in missing)
             
-            # Extract standard entities
+            for (key, text), doc in zip(missing.items(), docs):
+                results[key] = self._entities_from_doc(text, doc)
+                self._cache_store(self._entity_cache, key, results[key])
+        
+        return [copy.deepcopy(results[key]) for key in keys]
+    
+    def _extract_entities_uncached(self, text: str) -> Dict[str, Any]:
+        """Run entity extraction on text"""
+        return self._entities_from_doc(text, self.nlp(text) if self.nlp else None)
+    
+    def _entities_from_doc(self, text: str, doc: Optional[Any]) -> Dict[str, Any]:
+        """Entities of text, given its spaCy doc, or None to use the fallback patterns"""
+        # Only the lists filled entity by entity are created up front; the rest come
+        # straight from their extractors and the result dict is built once at the end
+        names: List[str] = []
+        organizations: List[str] = []
+        locations: List[str] = []
+        dates: List[str] = []
+        
+        if doc is not None:
+            # Extract standard entities, routed to their list by label
+            lists_by_label = {
+                "PERSON": names,
+                "ORG": organizations,
+                "GPE": locations,
+                "LOC": locations,
+                "DATE": dates
+            }
             for ent in doc.ents:
-                if ent.label_ == "PERSON":
-                    entities["names"].append(ent.text.strip())
-                elif ent.label_ == "ORG":
-                    entities["organizations"].append(ent.text.strip())
-                elif ent.label_ in ["GPE", "LOC"]:
-                    entities["locations"].append(ent.text.strip())
-                elif ent.label_ == "DATE":
-                    entities["dates"].append(ent.text.strip())
+                entity_list = lists_by_label.get(ent.label_)
+                if entity_list is not None:
+                    entity_list.append(ent.text.strip())
         else:
             # Fallback: simple pattern matching
             # Extract names (simple heuristic)
-            name_patterns = [
-                r'^([A-Z][a-z]+ [A-Z][a-z]+)',  # First Last at start of line
-                r'Name:?\s*([A-Z][a-z]+ [A-Z][a-z]+)',  # Name: First Last
-            ]
-            for pattern in name_patterns:
-                matches = re.findall(pattern, text, re.MULTILINE)
-                entities["names"].extend(matches)
-        
-        # Extract emails using regex (works with or without spaCy)
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        entities["emails"] = re.findall(email_pattern, text)
-        
-        # Extract phone numbers using regex
-        phone_pattern = r'(\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})'
-        phone_matches = re.findall(phone_pattern, text)
-        entities["phones"] = [''.join(match) for match in phone_matches]
-        
-        # Extract skills
-        entities["skills"] = self._extract_skills(text)
+            for pattern in _NAME_PATTERNS:
+                names.extend(pattern.findall(text))
         
-        # Extract education and experience sections
-        entities["education"] = self._extract_education(text)
-        entities["experience"] = self._extract_experience(text)
-        
-        return entities
+        return {
+            "names": names,
+            # Extract emails using regex (works with or without spaCy)
+            "emails": _EMAIL_PATTERN.findall(text),
+            # Extract phone numbers using regex
+            "phones": [''.join(match) for match in _PHONE_PATTERN.findall(text)],
+            "organizations": organizations,
+            "locations": locations,
+            "dates": dates,
+            "skills": self._extract_skills_uncached(text),
+            # Extract education and experience sections
+            "education": self._extract_education(text),
+            "experience": self._extract_experience(text)
+        }
     
     def _extract_skills(self, text: str) -> List[Dict[str, Any]]:
         """Extract and normalize skills from text"""
+        return self._memoized(self._skill_cache, text, self._extract_skills_uncached)
+    
+    def _extract_skills_uncached(self, text: str) -> List[Dict[str, Any]]:
+        """Scan text for taxonomy skills, reported in taxonomy order"""
         text_lower = text.lower()
-        found_skills = []
         
-        for category, skills in self.skill_taxonomy.items():
-            for skill in skills:
-                if skill.lower() in text_lower:
-                    found_skills.append({
-                        "skill": skill,
-                        "category": category,
-                        "confidence": 0.9  # Simple confidence score
-                    })
-        
-        # Remove duplicates
-        seen = set()
-        unique_skills = []
-        for skill in found_skills:
-            key = (skill["skill"], skill["category"])
-            if key not in seen:
-                seen.add(key)
-                unique_skills.append(skill)
+        if self._skill_automaton is not None:
+            # One pass finds every occurrence of every skill, overlaps included; an
+            # occurrence counts when the characters on either side are not word characters
+            found = set()
+            for end, (index, length) in self._skill_automaton.iter(text_lower):
+                start = end - length + 1
+                if (start == 0 or not _WORD_CHAR.match(text_lower, start - 1)) \
+                        and not _WORD_CHAR.match(text_lower, end + 1):
+                    found.add(index)
+        else:
+            words = set(_WORD.findall(text_lower))
+            found = {
+                index
+                for word in words & self._word_skill_indexes.keys()
+                for index in self._word_skill_indexes[word]
+            }
+            found.update(index for index, pattern in self._skill_patterns if pattern.search(text_lower))
         
-        return unique_skills
+        # Entries are distinct, so no duplicates need removing
+        return [
+            {
+                "skill": skill,
+                "category": category,
+                "confidence": 0.9  # Simple confidence score
+            }
+            for index, (skill, category, _) in enumerate(self._skill_entries)
+            if index in found
+        ]
     
     def _extract_education(self, text: str) -> List[Dict[str, Any]]:
         """Extract education information"""
         education = []
         
         # Common degree patterns
-        degree_patterns = [
-            r'(bachelor|master|phd|doctorate|associate).*?(?:degree|of|in)\s+([^\n]+)',
-            r'(b\.?s\.?|m\.?s\.?|m\.?a\.?|ph\.?d\.?|b\.?a\.?)\s+(?:in\s+)?([^\n]+)',
-        ]
-        
-        for pattern in degree_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in _DEGREE_PATTERNS:
+            for match in pattern.finditer(text):
                 education.append({
                     "degree": match.group(1).title(),
                     "field": match.group(2).strip(),
@@ -199,14 +385,8 @@ class NLPService:
         experience = []
         
         # Look for job titles and companies
-        job_patterns = [
-            r'(software engineer|developer|analyst|manager|director|consultant|specialist)\s+(?:at\s+)?([^\n]+)',
-            r'([A-Z][a-z]+\s+[A-Z][a-z]+)\s+(?:at\s+)?([A-Z][^\n]+)',
-        ]
-        
-        for pattern in job_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in _JOB_PATTERNS:
+            for match in pattern.finditer(text):
                 experience.append({
                     "title": match.group(1).strip(),
                     "company": match.group(2).strip(),
@@ -237,45 +417,78 @@ class NLPService:
     
     def normalize_skills(self, skills: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Normalize and deduplicate skills"""
-        normalized = []
-        skill_map = {}
+        skill_map: Dict[str, Dict[str, Any]] = {}
+        # (normalized name, variant) pairs already recorded, so variant checks are O(1)
+        seen_variants: Set[Tuple[str, str]] = set()
         
         for skill_data in skills:
-            skill_name = skill_data["skill"].lower()
-            
             # Check for synonyms and normalize
-            normalized_name = self._normalize_skill_name(skill_name)
+            variant = skill_data["skill"]
+            normalized_name = _canonical_skill_name(variant)
+            existing = skill_map.get(normalized_name)
             
-            if normalized_name not in skill_map:
+            if existing is None:
                 skill_map[normalized_name] = {
                     "skill": normalized_name,
                     "category": skill_data["category"],
                     "confidence": skill_data["confidence"],
-                    "variants": [skill_data["skill"]]
+                    "variants": [variant]
                 }
+                seen_variants.add((normalized_name, variant))
             else:
                 # Update confidence and add variant
-                existing = skill_map[normalized_name]
-                existing["confidence"] = max(existing["confidence"], skill_data["confidence"])
-                if skill_data["skill"] not in existing["variants"]:
-                    existing["variants"].append(skill_data["skill"])
+                if skill_data["confidence"] > existing["confidence"]:
+                    existing["confidence"] = skill_data["confidence"]
+                if (normalized_name, variant) not in seen_variants:
+                    seen_variants.add((normalized_name, variant))
+                    existing["variants"].append(variant)
+        
+        if DATASKETCH_AVAILABLE and len(skill_map) > _FUZZY_DEDUP_MIN_SKILLS:
+            return self._merge_near_duplicate_skills(list(skill_map.values()))
         
         return list(skill_map.values())
     
+    def _merge_near_duplicate_skills(self, normalized: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Merge normalized skills whose names are near duplicates, such as "python" and "python3".
+        
+        Candidates come from MinHash LSH over character 3-grams, so grouping stays linear in
+        the number of skills; each candidate pair is confirmed by edit similarity. A group keeps
+        the name and category of its first skill, the highest confidence and every variant.
+        """
+        lsh = MinHashLSH(threshold=_MINHASH_LSH_THRESHOLD, num_perm=_MINHASH_PERMUTATIONS)
+        # Index of the skill each skill was merged into; a skill is its own group until merged
+        group_of = list(range(len(normalized)))
+        
+        for index, skill_data in enumerate(normalized):
+            name = skill_data["skill"]
+            shingles = {name[i:i + 3] for i in range(len(name) - 2)}
+            if not shingles:
+                continue
+            
+            minhash = MinHash(num_perm=_MINHASH_PERMUTATIONS)
+            for shingle in shingles:
+                minhash.update(shingle.encode("utf-8"))
+            
+            for candidate in sorted(lsh.query(minhash)):
+                if difflib.SequenceMatcher(None, name, normalized[candidate]["skill"]).ratio() >= _FUZZY_DEDUP_SIMILARITY:
+                    group_of[index] = group_of[candidate]
+                    break
+            lsh.insert(index, minhash)
+        
+        merged: Dict[int, Dict[str, Any]] = {}
+        for index, skill_data in enumerate(normalized):
+            group = merged.get(group_of[index])
+            if group is None:
+                merged[group_of[index]] = skill_data
+            else:
+                if skill_data["confidence"] > group["confidence"]:
+                    group["confidence"] = skill_data["confidence"]
+                group["variants"].extend(
+                    variant for variant in skill_data["variants"] if variant not in group["variants"]
+                )
+        
+        return list(merged.values())
+    
     def _normalize_skill_name(self, skill: str) -> str:
         """Normalize skill name to canonical form"""
-        # Simple normalization rules
-        normalizations = {
-            "js": "javascript",
-            "ts": "typescript", 
-            "py": "python",
-            "node": "node.js",
-            "nodejs": "node.js",
-            "react.js": "react",
-            "reactjs": "react",
-            "vue.js": "vue",
-            "angular.js": "angular"
-        }
-        
-        skill_lower = skill.lower()
-        return normalizations.get(skill_lower, skill_lower)
\ No newline at end of file
+        return _canonical_skill_name(skill)
\ No newline at end of file
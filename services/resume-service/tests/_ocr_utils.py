@@ -0,0 +1,44 @@
+"""
+Shared image rendering and text comparison helpers for the OCR tests.
+"""
+
+import io
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont
+
+# Tesseract reads text reliably from about 30 px character height; the 10 px default
+# bitmap font mostly produced failed or empty OCR, skipping the assertions
+_FONT = ImageFont.load_default(size=40)
+
+
+@lru_cache(maxsize=256)
+def render(size, text, fmt):
+    """Encoded grayscale image of black text on white; Hypothesis repeats examples, so each is drawn once"""
+    img = Image.new('L', size, color=255)
+    draw = ImageDraw.Draw(img)
+    draw.text((20, 40), text, fill=0, font=_FONT)
+    
+    # Binarize the anti-aliased edges; JPEG cannot hold 1-bit images, so this stays 8-bit
+    img = img.point(lambda p: 0 if p < 128 else 255)
+    
+    img_bytes = io.BytesIO()
+    img.save(img_bytes, format=fmt)
+    return img_bytes.getvalue()
+
+
+@lru_cache(maxsize=1024)
+def char_mask(text):
+    """Which ASCII characters occur in text, ignoring case and spaces, as an int bitmask"""
+    mask = 0
+    for code in text.lower().encode('ascii', 'ignore'):
+        mask |= 1 << code
+    return mask & ~(1 << ord(' '))
+
+
+def char_overlap(text, other):
+    """Fraction of the distinct characters of text that also occur in other"""
+    mask = char_mask(text)
+    if not mask:
+        return 0.0
+    return (mask & char_mask(other)).bit_count() / mask.bit_count()
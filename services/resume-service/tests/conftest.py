@@ -6,6 +6,20 @@ import pytest
 import tempfile
 import os
 from pathlib import Path
+from hypothesis import settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+# One OpenMP thread per Tesseract call; xdist already runs a worker per core, and OCR
+# tests otherwise oversubscribe the CPU
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+# Keep the Hypothesis example database next to the service rather than the working
+# directory, so failures found by any run are replayed first whichever directory pytest starts from
+settings.register_profile(
+    "resume-service",
+    database=DirectoryBasedExampleDatabase(str(Path(__file__).resolve().parent.parent / ".hypothesis" / "examples"))
+)
+settings.load_profile("resume-service")
 
 @pytest.fixture
 def sample_pdf_content():
@@ -0,0 +1,36 @@
+"""
+API tests for batch resume parsing.
+"""
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+class TestBatchParsingAPI:
+    """Tests for the /parse-batch endpoint"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.client = TestClient(app)
+    
+    def test_unsupported_file_reported_per_file(self):
+        """Test that an unsupported file gets its own error entry without failing the batch"""
+        files = [
+            ('files', ('resume.txt', b"John Doe\njohn.doe@email.com\nSkills: Python, Docker", 'text/plain')),
+            ('files', ('resume.exe', b"MZ", 'application/octet-stream')),
+        ]
+        
+        response = self.client.post('/parse-batch', files=files)
+        
+        assert response.status_code == 200
+        body = response.json()
+        assert body['count'] == 2
+        
+        parsed, rejected = body['results']
+        assert parsed['filename'] == 'resume.txt'
+        assert 'john.doe@email.com' in parsed['extracted_data']['emails']
+        assert rejected == {
+            'filename': 'resume.exe',
+            'error': 'Failed to process document: Unsupported file format: .exe'
+        }
@@ -8,23 +8,26 @@ Feature: recruitment-testing-platform, Property 4: Multi-format Parsing Consiste
 """
 
 import pytest
-from hypothesis import given, strategies as st, assume
-import tempfile
-import os
+from hypothesis import given, settings, strategies as st
 from pathlib import Path
 
 from app.services.document_processor import DocumentProcessor
 from app.services.nlp_service import NLPService
 
+# Lowercase skill vocabulary for the structured content strategy
+_SKILL_VOCAB = ('python', 'javascript', 'react', 'java', 'sql', 'docker')
+
 
 class TestMultiFormatParsingProperty:
     """Property tests for multi-format parsing consistency"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.processor = DocumentProcessor()
-        self.nlp_service = NLPService()
+    @classmethod
+    def setup_class(cls):
+        """Set up test fixtures once; every example of every test shares them"""
+        cls.processor = DocumentProcessor()
+        cls.nlp_service = NLPService()
     
+    @settings(max_examples=50)
     @given(
         text_content=st.sampled_from([
             "John Doe Software Engineer john@email.com Python JavaScript",
@@ -41,59 +44,54 @@ class TestMultiFormatParsingProperty:
         
         **Validates: Requirements 2.1, 2.2**
         """
-        # Create temporary files with the same content in different formats
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create TXT file
-            txt_path = os.path.join(temp_dir, 'test.txt')
-            with open(txt_path, 'w', encoding='utf-8') as f:
-                f.write(text_content)
-            
-            # Process TXT file
-            with open(txt_path, 'rb') as f:
-                txt_content_bytes = f.read()
-            
-            txt_result = self.processor.process_document(txt_content_bytes, 'test.txt')
-            
-            # Skip if processing failed
-            if not txt_result['metadata']['success'] or len(txt_result['text'].strip()) == 0:
-                return  # Skip this test case
-            
-            # Extract entities from TXT
-            txt_entities = self.nlp_service.extract_entities(txt_result['text'])
-            
-            # Create a simple DOCX-like structure (for testing purposes)
-            # In a real implementation, this would create actual DOCX files
-            docx_result = {
-                'text': text_content,
-                'metadata': {'format': 'docx', 'success': True}
-            }
-            
-            # Extract entities from DOCX-like content
+        # Process the content as a TXT upload; it is already in memory, so it never touches disk
+        txt_content_bytes = text_content.encode('utf-8')
+        txt_result = self.processor.process_document(txt_content_bytes, 'test.txt')
+        
+        # The sampled contents are always valid text, so processing must succeed
+        assert txt_result['metadata']['success']
+        assert txt_result['text'].strip()
+        
+        # Extract entities from TXT
+        txt_entities = self.nlp_service.extract_entities(txt_result['text'])
+        
+        # Create a simple DOCX-like structure (for testing purposes)
+        # In a real implementation, this would create actual DOCX files
+        docx_result = {
+            'text': text_content,
+            'metadata': {'format': 'docx', 'success': True}
+        }
+        
+        # Extract entities from DOCX-like content; identical text has identical entities
+        if docx_result['text'] == txt_result['text']:
+            docx_entities = txt_entities
+        else:
             docx_entities = self.nlp_service.extract_entities(docx_result['text'])
-            
-            # Property: Core extracted information should be consistent across formats
-            # Check emails
-            if txt_entities['emails']:
-                assert len(docx_entities['emails']) > 0, "Email extraction should be consistent across formats"
-                # At least some emails should match
-                common_emails = set(txt_entities['emails']) & set(docx_entities['emails'])
-                assert len(common_emails) > 0, "Should have common emails across formats"
-            
-            # Check skills
-            if txt_entities['skills']:
-                assert len(docx_entities['skills']) > 0, "Skill extraction should be consistent across formats"
-                # At least some skills should match
-                txt_skill_names = {skill['skill'] for skill in txt_entities['skills']}
-                docx_skill_names = {skill['skill'] for skill in docx_entities['skills']}
-                common_skills = txt_skill_names & docx_skill_names
-                assert len(common_skills) > 0, "Should have common skills across formats"
-            
-            # Check names (if any found)
-            if txt_entities['names'] and docx_entities['names']:
-                # At least some names should match
-                common_names = set(txt_entities['names']) & set(docx_entities['names'])
-                assert len(common_names) > 0, "Should have common names across formats"
+        
+        # Property: Core extracted information should be consistent across formats
+        # Check emails
+        if txt_entities['emails']:
+            assert len(docx_entities['emails']) > 0, "Email extraction should be consistent across formats"
+            # At least some emails should match
+            common_emails = set(txt_entities['emails']) & set(docx_entities['emails'])
+            assert len(common_emails) > 0, "Should have common emails across formats"
+        
+        # Check skills
+        if txt_entities['skills']:
+            assert len(docx_entities['skills']) > 0, "Skill extraction should be consistent across formats"
+            # At least some skills should match
+            txt_skill_names = {skill['skill'] for skill in txt_entities['skills']}
+            docx_skill_names = {skill['skill'] for skill in docx_entities['skills']}
+            common_skills = txt_skill_names & docx_skill_names
+            assert len(common_skills) > 0, "Should have common skills across formats"
+        
+        # Check names (if any found)
+        if txt_entities['names'] and docx_entities['names']:
+            # At least some names should match
+            common_names = set(txt_entities['names']) & set(docx_entities['names'])
+            assert len(common_names) > 0, "Should have common names across formats"
     
+    @settings(max_examples=50)
     @given(
         email=st.sampled_from([
             "john.doe@email.com",
@@ -103,7 +101,7 @@ class TestMultiFormatParsingProperty:
             "engineer@startup.io"
         ]),
         skills=st.lists(
-            st.sampled_from(['python', 'javascript', 'react', 'java', 'sql', 'docker']),
+            st.sampled_from(_SKILL_VOCAB),
             min_size=1,
             max_size=5
         ),
@@ -137,7 +135,7 @@ class TestMultiFormatParsingProperty:
         
         # Process as different formats
         txt_result = self.processor.process_document(content.encode('utf-8'), 'resume.txt')
-        assume(txt_result['metadata']['success'])
+        assert txt_result['metadata']['success']
         
         # Extract entities
         entities = self.nlp_service.extract_entities(txt_result['text'])
@@ -147,8 +145,8 @@ class TestMultiFormatParsingProperty:
         
         # Property: Should extract at least some of the skills we put in
         extracted_skill_names = {skill['skill'].lower() for skill in entities['skills']}
-        input_skills_lower = {skill.lower() for skill in skills}
-        common_skills = extracted_skill_names & input_skills_lower
+        # The vocabulary is already lowercase
+        common_skills = extracted_skill_names.intersection(skills)
         assert len(common_skills) > 0, f"Should extract at least some skills from {skills}"
         
         # Property: Confidence score should be reasonable for structured content
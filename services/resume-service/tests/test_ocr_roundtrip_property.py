@@ -8,26 +8,36 @@ Feature: recruitment-testing-platform, Property 5: OCR Processing Round-trip
 """
 
 import pytest
-from hypothesis import given, strategies as st, assume
+from hypothesis import given, settings, strategies as st, assume, HealthCheck, Phase
 import tempfile
 import os
-from PIL import Image, ImageDraw, ImageFont
-import io
+from concurrent.futures import ThreadPoolExecutor
 
 from app.services.document_processor import DocumentProcessor
+from tests._ocr_utils import render, char_mask, char_overlap
+
+# Every OCR example runs Tesseract, so few examples are drawn and failures are not shrunk or explained
+_OCR_SETTINGS = settings(
+    max_examples=20,
+    phases=(Phase.explicit, Phase.generate),
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow]
+)
 
 
 class TestOCRRoundtripProperty:
     """Property tests for OCR processing round-trip consistency"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.processor = DocumentProcessor()
+    @classmethod
+    def setup_class(cls):
+        """Set up test fixtures once; every example of every test shares them"""
+        cls.processor = DocumentProcessor()
         
         # Skip all tests if OCR is not available
-        if '.png' not in self.processor.supported_formats:
+        if '.png' not in cls.processor.supported_formats:
             pytest.skip("OCR processing not available - pytesseract/PIL not installed")
     
+    @_OCR_SETTINGS
     @given(
         text_content=st.sampled_from([
             "John Doe",
@@ -44,23 +54,8 @@ class TestOCRRoundtripProperty:
         
         **Validates: Requirements 2.3**
         """
-        # Create a simple image with text
-        img = Image.new('RGB', (400, 100), color='white')
-        draw = ImageDraw.Draw(img)
-        
-        try:
-            # Try to use a default font, fall back to basic if not available
-            font = ImageFont.load_default()
-        except:
-            font = None
-        
-        # Draw text on image
-        draw.text((10, 10), text_content, fill='black', font=font)
-        
-        # Convert image to bytes
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format='PNG')
-        img_bytes = img_bytes.getvalue()
+        # Create a simple PNG image with text
+        img_bytes = render((600, 150), text_content, 'PNG')
         
         # Process image with OCR
         result = self.processor.process_document(img_bytes, 'test.png')
@@ -74,12 +69,8 @@ class TestOCRRoundtripProperty:
         # Property: OCR should extract some recognizable text
         if len(extracted_text) > 0:
             # Check if at least some characters match
-            original_chars = set(text_content.lower().replace(' ', ''))
-            extracted_chars = set(extracted_text.lower().replace(' ', ''))
-            
-            if len(original_chars) > 0:
-                common_chars = original_chars & extracted_chars
-                char_similarity = len(common_chars) / len(original_chars)
+            if char_mask(text_content):
+                char_similarity = char_overlap(text_content, extracted_text)
                 
                 # Property: Should have some character similarity
                 assert char_similarity > 0.1, f"OCR should extract some recognizable characters. Original: '{text_content}', Extracted: '{extracted_text}'"
@@ -94,13 +85,7 @@ class TestOCRRoundtripProperty:
         **Validates: Requirements 2.3**
         """
         # Create a high-quality image with clear text
-        img = Image.new('RGB', (300, 50), color='white')
-        draw = ImageDraw.Draw(img)
-        draw.text((10, 10), "John Doe Engineer", fill='black')
-        
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format='PNG')
-        img_bytes = img_bytes.getvalue()
+        img_bytes = render((500, 130), "John Doe Engineer", 'PNG')
         
         # Process with OCR
         result = self.processor.process_document(img_bytes, 'clear_text.png')
@@ -121,11 +106,9 @@ class TestOCRRoundtripProperty:
             if result['metadata'].get('ocr'):
                 assert 'ocr' in str(quality), "Quality assessment should mention OCR processing"
     
+    @_OCR_SETTINGS
     @given(
-        image_size=st.tuples(
-            st.integers(min_value=100, max_value=500),
-            st.integers(min_value=50, max_value=200)
-        ),
+        image_size=st.sampled_from([(560, 130), (700, 150), (900, 200)]),
         text_content=st.sampled_from([
             "Software Engineer",
             "john.doe@email.com", 
@@ -140,27 +123,21 @@ class TestOCRRoundtripProperty:
         
         **Validates: Requirements 2.3**
         """
-        width, height = image_size
-        
-        # Create image with text
-        img = Image.new('RGB', (width, height), color='white')
-        draw = ImageDraw.Draw(img)
-        draw.text((10, 10), text_content, fill='black')
-        
-        # Test different formats
+        # Test different formats; Tesseract releases the GIL, so both are recognized concurrently
         formats = ['PNG', 'JPEG']
-        results = {}
         
-        for fmt in formats:
-            img_bytes = io.BytesIO()
-            img.save(img_bytes, format=fmt)
-            img_bytes = img_bytes.getvalue()
-            
-            filename = f'test.{fmt.lower()}'
-            result = self.processor.process_document(img_bytes, filename)
-            
-            if result['metadata']['success']:
-                results[fmt] = result
+        with ThreadPoolExecutor(max_workers=len(formats)) as executor:
+            futures = {
+                fmt: executor.submit(
+                    self.processor.process_document,
+                    render(image_size, text_content, fmt),
+                    f'test.{fmt.lower()}'
+                )
+                for fmt in formats
+            }
+            results = {fmt: future.result() for fmt, future in futures.items()}
+        
+        results = {fmt: result for fmt, result in results.items() if result['metadata']['success']}
         
         # Property: If both formats processed successfully, 
         # they should extract similar information
@@ -177,12 +154,7 @@ class TestOCRRoundtripProperty:
             text1 = result1['text'].strip()
             text2 = result2['text'].strip()
             
-            if text1 and text2:
+            if char_mask(text1) and char_mask(text2):
                 # Should have some common characters
-                chars1 = set(text1.lower().replace(' ', ''))
-                chars2 = set(text2.lower().replace(' ', ''))
-                
-                if chars1 and chars2:
-                    common = chars1 & chars2
-                    similarity = len(common) / max(len(chars1), len(chars2))
-                    assert similarity > 0.3, f"Different image formats should extract similar text. {format_names[0]}: '{text1}', {format_names[1]}: '{text2}'"
\ No newline at end of file
+                similarity = min(char_overlap(text1, text2), char_overlap(text2, text1))
+                assert similarity > 0.3, f"Different image formats should extract similar text. {format_names[0]}: '{text1}', {format_names[1]}: '{text2}'"
\ No newline at end of file
@@ -7,30 +7,48 @@ Property test for parsing accuracy threshold.
 Feature: recruitment-testing-platform, Property 6: Parsing Accuracy Threshold
 """
 
+import itertools
+
 import pytest
-from hypothesis import given, strategies as st, assume
+from hypothesis import given, settings, strategies as st, assume, HealthCheck, Phase
 
 from app.services.nlp_service import NLPService
 from app.services.document_processor import DocumentProcessor
 
+# Resume texts for the confidence/accuracy property, extracted once as a batch
+_RESUME_CONTENTS = (
+    "John Doe Software Engineer john@email.com Python JavaScript React",
+    "Jane Smith Developer jane.smith@company.com Java Spring SQL Docker",
+    "Alex Johnson Engineer alex@tech.co Python Data Science Machine Learning",
+    "Sarah Wilson Analyst sarah@startup.io JavaScript React Node.js MongoDB",
+    "Mike Brown Developer mike.brown@email.org Python Django PostgreSQL AWS"
+)
+_ENTITY_KEYS = ("names", "emails", "phones", "skills", "education", "experience")
+
+# assess_quality only branches at 50 characters and 50/70 OCR confidence, so a few
+# lengths and confidences either side of those thresholds cover every score
+_TEXT_FIXTURES = {n: 'x' * n for n in (1, 10, 49, 50, 100, 500, 2000)}
+_OCR_CONFIDENCES = (0, 25, 49, 50, 69, 70, 75, 100)
+
 
 class TestParsingAccuracyProperty:
     """Property tests for parsing accuracy threshold"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.nlp_service = NLPService()
-        self.processor = DocumentProcessor()
+    @classmethod
+    def setup_class(cls):
+        """Set up test fixtures once; every example of every test shares them"""
+        cls.nlp_service = NLPService()
+        cls.processor = DocumentProcessor()
+        cls.precomputed_entities = dict(zip(
+            _RESUME_CONTENTS, cls.nlp_service.extract_entities_batch(list(_RESUME_CONTENTS))
+        ))
     
-    @given(
-        quality_indicators=st.dictionaries(
-            keys=st.sampled_from(['has_email', 'has_phone', 'has_skills', 'has_name', 'text_length']),
-            values=st.booleans() | st.integers(min_value=10, max_value=1000),
-            min_size=3,
-            max_size=5
-        )
+    # Only the presence of each element matters, so every combination is checked
+    @pytest.mark.parametrize(
+        'has_name,has_email,has_phone,has_skills',
+        list(itertools.product([True, False], repeat=4))
     )
-    def test_confidence_score_accuracy_correlation(self, quality_indicators):
+    def test_confidence_score_accuracy_correlation(self, has_name, has_email, has_phone, has_skills):
         """
         Property: Confidence scores should correlate with the presence of 
         identifiable resume elements.
@@ -39,10 +57,10 @@ class TestParsingAccuracyProperty:
         """
         # Create mock extracted data based on quality indicators
         extracted_data = {
-            "names": ["John Doe"] if quality_indicators.get('has_name', False) else [],
-            "emails": ["john@email.com"] if quality_indicators.get('has_email', False) else [],
-            "phones": ["555-1234"] if quality_indicators.get('has_phone', False) else [],
-            "skills": [{"skill": "python", "category": "programming", "confidence": 0.9}] if quality_indicators.get('has_skills', False) else [],
+            "names": ["John Doe"] if has_name else [],
+            "emails": ["john@email.com"] if has_email else [],
+            "phones": ["555-1234"] if has_phone else [],
+            "skills": [{"skill": "python", "category": "programming", "confidence": 0.9}] if has_skills else [],
             "education": [],
             "experience": []
         }
@@ -54,14 +72,7 @@ class TestParsingAccuracyProperty:
         assert 0.0 <= confidence <= 1.0, "Confidence score should be between 0 and 1"
         
         # Property: More extracted elements should lead to higher confidence
-        element_count = sum([
-            len(extracted_data["names"]) > 0,
-            len(extracted_data["emails"]) > 0,
-            len(extracted_data["phones"]) > 0,
-            len(extracted_data["skills"]) > 0,
-            len(extracted_data["education"]) > 0,
-            len(extracted_data["experience"]) > 0
-        ])
+        element_count = sum(1 for key in _ENTITY_KEYS if extracted_data[key])
         
         if element_count == 0:
             assert confidence == 0.0, "No extracted elements should result in zero confidence"
@@ -131,9 +142,11 @@ class TestParsingAccuracyProperty:
                 assert quality['quality_score'] > 0.7, "High quality should have score > 0.7"
                 assert not quality['needs_review'], "High quality should not need review"
     
+    @settings(max_examples=20, phases=(Phase.explicit, Phase.generate), deadline=None,
+              suppress_health_check=[HealthCheck.too_slow])
     @given(
-        text_length=st.integers(min_value=1, max_value=2000),
-        ocr_confidence=st.integers(min_value=0, max_value=100)
+        text_length=st.sampled_from(list(_TEXT_FIXTURES)),
+        ocr_confidence=st.sampled_from(_OCR_CONFIDENCES)
     )
     def test_quality_score_monotonicity(self, text_length, ocr_confidence):
         """
@@ -143,7 +156,7 @@ class TestParsingAccuracyProperty:
         """
         # Create test results with different quality parameters
         result_low_confidence = {
-            'text': 'x' * text_length,
+            'text': _TEXT_FIXTURES[text_length],
             'metadata': {
                 'success': True,
                 'format': 'image',
@@ -153,7 +166,7 @@ class TestParsingAccuracyProperty:
         }
         
         result_high_confidence = {
-            'text': 'x' * text_length,
+            'text': _TEXT_FIXTURES[text_length],
             'metadata': {
                 'success': True,
                 'format': 'image',
@@ -200,35 +213,23 @@ class TestParsingAccuracyProperty:
                 assert quality['needs_review'], f"Should flag for review: {case}"
                 assert len(quality['issues']) > 0, "Should report specific issues"
     
-    @given(
-        resume_content=st.sampled_from([
-            "John Doe Software Engineer john@email.com Python JavaScript React",
-            "Jane Smith Developer jane.smith@company.com Java Spring SQL Docker",
-            "Alex Johnson Engineer alex@tech.co Python Data Science Machine Learning",
-            "Sarah Wilson Analyst sarah@startup.io JavaScript React Node.js MongoDB",
-            "Mike Brown Developer mike.brown@email.org Python Django PostgreSQL AWS"
-        ])
-    )
+    @settings(max_examples=50)
+    @given(resume_content=st.sampled_from(_RESUME_CONTENTS))
     def test_confidence_accuracy_relationship(self, resume_content):
         """
         Property: Higher confidence scores should correlate with more accurate extractions.
         
         **Validates: Requirements 2.4**
         """
-        # Extract entities
-        entities = self.nlp_service.extract_entities(resume_content)
+        # Entities were extracted for every sampled text in setup_class
+        entities = self.precomputed_entities[resume_content]
         confidence = self.nlp_service.calculate_confidence_score(entities)
+        total_entities = sum(len(entities[key]) for key in _ENTITY_KEYS)
         
         # Property: If confidence is high, should have extracted meaningful data
         if confidence > 0.8:
-            total_entities = (len(entities['names']) + len(entities['emails']) + 
-                            len(entities['phones']) + len(entities['skills']) + 
-                            len(entities['education']) + len(entities['experience']))
             assert total_entities >= 3, "High confidence should correlate with multiple extracted entities"
         
         # Property: If confidence is very low, should have few entities
         if confidence < 0.2:
-            total_entities = (len(entities['names']) + len(entities['emails']) + 
-                            len(entities['phones']) + len(entities['skills']) + 
-                            len(entities['education']) + len(entities['experience']))
             assert total_entities <= 2, "Low confidence should correlate with few extracted entities"
\ No newline at end of file
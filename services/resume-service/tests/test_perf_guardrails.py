@@ -0,0 +1,67 @@
+"""
+Performance guardrails for the NLP and OCR hot paths.
+
+The property tests call these paths in tight Hypothesis loops, so a slow
+regression multiplies across the whole suite. Benchmarks are disabled
+under pytest-xdist, so run them without it:
+
+    pytest -m perf -p no:xdist -o addopts=""
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from app.services.nlp_service import NLPService
+from app.services.document_processor import DocumentProcessor
+from tests._ocr_utils import render
+
+pytestmark = pytest.mark.perf
+
+# Mean wall time per uncached call, in seconds
+_ENTITY_EXTRACTION_BUDGET = 0.05
+_OCR_BUDGET = 1.0
+
+
+class TestPerfGuardrails:
+    """Wall-time budgets for entity extraction and OCR"""
+    
+    @classmethod
+    def setup_class(cls):
+        """Set up test fixtures once"""
+        cls.nlp_service = NLPService()
+        cls.processor = DocumentProcessor()
+    
+    @pytest.fixture(autouse=True)
+    def _require_benchmark(self, benchmark):
+        """Skip when pytest-xdist has disabled benchmarking"""
+        if benchmark.disabled:
+            pytest.skip("benchmarks are disabled under pytest-xdist; run with -p no:xdist")
+    
+    def test_extract_entities_perf(self, benchmark):
+        """Test that uncached entity extraction stays within its time budget"""
+        text = "John Doe\njohn.doe@email.com\nSoftware Engineer at Tech Corp\nSkills: Python, Docker, AWS"
+        
+        # Clear the memoized results so every round runs the full pipeline
+        entities = benchmark.pedantic(
+            self.nlp_service.extract_entities, args=(text,),
+            setup=self.nlp_service._entity_cache.clear, rounds=20
+        )
+        
+        assert 'john.doe@email.com' in entities['emails']
+        assert benchmark.stats['mean'] < _ENTITY_EXTRACTION_BUDGET
+    
+    def test_process_png_perf(self, benchmark):
+        """Test that uncached OCR of a PNG stays within its time budget"""
+        if '.png' not in self.processor.supported_formats:
+            pytest.skip("OCR processing not available - pytesseract/PIL not installed")
+        
+        img_bytes = render((600, 150), "Software Engineer", 'PNG')
+        
+        result = benchmark.pedantic(
+            self.processor.process_document, args=(img_bytes, 'resume.png'),
+            setup=self.processor._result_cache.clear, rounds=5
+        )
+        
+        assert result['metadata']['success']
+        assert benchmark.stats['mean'] < _OCR_BUDGET
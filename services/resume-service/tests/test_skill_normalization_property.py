@@ -7,67 +7,94 @@ Property test for skill normalization consistency.
 Feature: recruitment-testing-platform, Property 7: Skill Normalization Consistency
 """
 
+from collections import defaultdict
+
 import pytest
-from hypothesis import given, strategies as st, assume
+from hypothesis import given, settings, strategies as st, Phase
 
 from app.services.nlp_service import NLPService
 
+# Normalization is deterministic and cheap to replay, so fewer examples are drawn and
+# failures are reported as found instead of shrunk
+_NORMALIZATION_SETTINGS = settings(
+    max_examples=25,
+    deadline=None,
+    phases=(Phase.explicit, Phase.reuse, Phase.generate)
+)
+
+# Every skill dict the idempotency test can draw; only the names affect normalization,
+# so a few confidences stand in for the full float range. Copied per draw with dict.
+_CANDIDATE_SKILLS = tuple(
+    {'skill': skill, 'category': category, 'confidence': confidence}
+    for skill in ('Python', 'python', 'PYTHON', 'py', 'JavaScript', 'javascript', 'JS', 'js', 'React', 'react.js', 'ReactJS')
+    for category in ('programming', 'web', 'database')
+    for confidence in (0.1, 0.5, 0.9, 1.0)
+)
+_SKILL_LIST_STRATEGY = st.lists(st.sampled_from(_CANDIDATE_SKILLS).map(dict), min_size=1, max_size=10)
+
+# Spellings of two skills with different confidences, for the deduplication test
+_DUPLICATE_SKILLS_STRATEGY = st.lists(
+    st.sampled_from([
+        {'skill': 'Python', 'category': 'programming', 'confidence': 0.9},
+        {'skill': 'python', 'category': 'programming', 'confidence': 0.8},
+        {'skill': 'PYTHON', 'category': 'programming', 'confidence': 0.7},
+        {'skill': 'JavaScript', 'category': 'web', 'confidence': 0.9},
+        {'skill': 'javascript', 'category': 'web', 'confidence': 0.8},
+        {'skill': 'JS', 'category': 'web', 'confidence': 0.6},
+    ]),
+    min_size=2,
+    max_size=6
+)
+
+# Known synonyms and the canonical form each group normalizes to
+_SYNONYM_GROUPS = (
+    (('JavaScript', 'javascript', 'JS', 'js'), 'javascript'),
+    (('Python', 'python', 'py'), 'python'),
+    (('React', 'react.js', 'ReactJS'), 'react'),
+    (('Node.js', 'node', 'nodejs'), 'node.js'),
+)
+
+# Skills and the category they are expected to keep through normalization
+_CATEGORY_CASES = (
+    ('python', 'programming'),
+    ('javascript', 'programming'),
+    ('react', 'web'),
+    ('mysql', 'database'),
+    ('aws', 'cloud'),
+    ('pandas', 'data'),
+)
+
 
 class TestSkillNormalizationProperty:
     """Property tests for skill normalization consistency"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.nlp_service = NLPService()
+    @classmethod
+    def setup_class(cls):
+        """Set up test fixtures once; every example of every test shares them"""
+        cls.nlp_service = NLPService()
     
-    @given(
-        skills_input=st.lists(
-            st.fixed_dictionaries({
-                'skill': st.sampled_from(['Python', 'python', 'PYTHON', 'py', 'JavaScript', 'javascript', 'JS', 'js', 'React', 'react.js', 'ReactJS']),
-                'category': st.sampled_from(['programming', 'web', 'database']),
-                'confidence': st.floats(min_value=0.1, max_value=1.0)
-            }),
-            min_size=1,
-            max_size=10
-        )
-    )
+    @_NORMALIZATION_SETTINGS
+    @given(skills_input=_SKILL_LIST_STRATEGY)
     def test_skill_normalization_idempotency(self, skills_input):
         """
         Property: Normalizing skills multiple times should produce the same result.
         
         **Validates: Requirements 2.7**
         """
-        assume(len(skills_input) > 0)
-        assume(all(isinstance(skill.get('skill'), str) for skill in skills_input))
-        
         # First normalization
         normalized_once = self.nlp_service.normalize_skills(skills_input)
         
         # Second normalization (should be idempotent)
         normalized_twice = self.nlp_service.normalize_skills(normalized_once)
         
-        # Property: Normalizing twice should give same result as normalizing once
-        assert len(normalized_once) == len(normalized_twice), "Normalization should be idempotent"
-        
-        # Check that skill names are the same
-        skills_once = {skill['skill'] for skill in normalized_once}
-        skills_twice = {skill['skill'] for skill in normalized_twice}
+        # Property: Normalizing twice should give the same skill names as normalizing once;
+        # comparing sorted lists also checks that no skill was added or dropped
+        skills_once = sorted(skill['skill'] for skill in normalized_once)
+        skills_twice = sorted(skill['skill'] for skill in normalized_twice)
         assert skills_once == skills_twice, "Skill names should be identical after repeated normalization"
     
-    @given(
-        duplicate_skills=st.lists(
-            st.sampled_from([
-                {'skill': 'Python', 'category': 'programming', 'confidence': 0.9},
-                {'skill': 'python', 'category': 'programming', 'confidence': 0.8},
-                {'skill': 'PYTHON', 'category': 'programming', 'confidence': 0.7},
-                {'skill': 'JavaScript', 'category': 'web', 'confidence': 0.9},
-                {'skill': 'javascript', 'category': 'web', 'confidence': 0.8},
-                {'skill': 'JS', 'category': 'web', 'confidence': 0.6},
-            ]),
-            min_size=2,
-            max_size=6
-        )
-    )
+    @_NORMALIZATION_SETTINGS
+    @given(duplicate_skills=_DUPLICATE_SKILLS_STRATEGY)
     def test_skill_deduplication_consistency(self, duplicate_skills):
         """
         Property: Skills with the same normalized name should be deduplicated,
@@ -75,8 +102,6 @@ class TestSkillNormalizationProperty:
         
         **Validates: Requirements 2.7**
         """
-        assume(len(duplicate_skills) >= 2)
-        
         # Normalize skills
         normalized = self.nlp_service.normalize_skills(duplicate_skills)
         
@@ -84,19 +109,19 @@ class TestSkillNormalizationProperty:
         skill_names = [skill['skill'] for skill in normalized]
         assert len(skill_names) == len(set(skill_names)), "Should not have duplicate normalized skill names"
         
+        # Group the original confidences by normalized name in one pass
+        original_confidences = defaultdict(list)
+        for orig_skill in duplicate_skills:
+            norm_name = self.nlp_service._normalize_skill_name(orig_skill['skill'])
+            original_confidences[norm_name].append(orig_skill['confidence'])
+        
         # Property: For each normalized skill, confidence should be the maximum
         # from the original duplicates
         for norm_skill in normalized:
             norm_name = norm_skill['skill']
             
-            # Find all original skills that would normalize to this name
-            original_confidences = []
-            for orig_skill in duplicate_skills:
-                if self.nlp_service._normalize_skill_name(orig_skill['skill']) == norm_name:
-                    original_confidences.append(orig_skill['confidence'])
-            
-            if original_confidences:
-                max_confidence = max(original_confidences)
+            if norm_name in original_confidences:
+                max_confidence = max(original_confidences[norm_name])
                 assert norm_skill['confidence'] == max_confidence, f"Confidence should be maximum for {norm_name}"
     
     def test_skill_synonym_normalization(self):
@@ -106,14 +131,7 @@ class TestSkillNormalizationProperty:
         **Validates: Requirements 2.7**
         """
         # Test known synonyms
-        synonym_groups = [
-            (['JavaScript', 'javascript', 'JS', 'js'], 'javascript'),
-            (['Python', 'python', 'py'], 'python'),
-            (['React', 'react.js', 'ReactJS'], 'react'),
-            (['Node.js', 'node', 'nodejs'], 'node.js'),
-        ]
-        
-        for synonyms, expected_canonical in synonym_groups:
+        for synonyms, expected_canonical in _SYNONYM_GROUPS:
             skills_input = [
                 {'skill': synonym, 'category': 'programming', 'confidence': 0.8}
                 for synonym in synonyms
@@ -131,6 +149,7 @@ class TestSkillNormalizationProperty:
             assert 'variants' in canonical_skill, "Should preserve original variants"
             assert len(canonical_skill['variants']) == len(synonyms), "Should preserve all variants"
     
+    @_NORMALIZATION_SETTINGS
     @given(
         text_content=st.sampled_from([
             "John Doe python developer experience",
@@ -167,8 +186,7 @@ class TestSkillNormalizationProperty:
                 assert skill['skill'].islower() or '.' in skill['skill'], "Canonical skill names should be lowercase"
                 
                 # Property: Variants should include the canonical form
-                variant_names = [v.lower() for v in skill['variants']]
-                assert skill['skill'] in variant_names, "Variants should include the canonical form"
+                assert any(v.lower() == skill['skill'] for v in skill['variants']), "Variants should include the canonical form"
     
     def test_skill_category_consistency(self):
         """
@@ -177,16 +195,7 @@ class TestSkillNormalizationProperty:
         **Validates: Requirements 2.7**
         """
         # Test skills with known categories
-        test_cases = [
-            ('python', 'programming'),
-            ('javascript', 'programming'),
-            ('react', 'web'),
-            ('mysql', 'database'),
-            ('aws', 'cloud'),
-            ('pandas', 'data'),
-        ]
-        
-        for skill_name, expected_category in test_cases:
+        for skill_name, expected_category in _CATEGORY_CASES:
             skills_input = [{'skill': skill_name, 'category': expected_category, 'confidence': 0.8}]
             normalized = self.nlp_service.normalize_skills(skills_input)
             